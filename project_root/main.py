@@ -11,12 +11,23 @@ def main():
     
     print("🔄 Generando horario...")
     service = SchedulingService(excel_path, course_config_path)
-    assignments = service.run()
+    assignments = service.run(allow_partial=True, time_limit=60)
+
+    report = service.presolve_report
+    if report is not None and not report.feasible:
+        print("\n📉 Faltan recursos por tipo de aula:\n")
+        for line in str(report).splitlines():
+            print(f"  {line}")
 
     if not assignments:
         print("❌ No se pudo generar un horario válido.")
         return
 
+    if service.unplaced:
+        print(f"\n⚠️  Horario parcial: {len(service.unplaced)} grupos sin asignar:")
+        for group_id in service.unplaced:
+            print(f"  - {group_id}")
+
     # Load time model for export
     reader = ExcelReader(excel_path)
     availability = reader.load_availability()
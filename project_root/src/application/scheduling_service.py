@@ -1,26 +1,61 @@
 # src/application/scheduling_service.py
 
+from functools import partial
+
 from ..scheduling.time_model import TimeModel
 from ..scheduling.schedule_state import ScheduleState
-from ..scheduling.scheduler import Scheduler
+from ..scheduling.greedy import GreedyScheduler
+from ..scheduling.decomposition import DecomposedScheduler
+from ..scheduling.partial import PartialScheduler
+from ..scheduling.portfolio import PortfolioScheduler
+from ..scheduling.incremental import IncrementalScheduler
 from ..infrastructure.excel_reader import ExcelReader
 from ..infrastructure.course_config_reader import CourseConfigReader
 
 
 class SchedulingService:
 
-    def __init__(self, excel_path: str, course_config_path: str):
+    def __init__(self, excel_path: str, course_config_path: str, workers: int = 1):
         """
         Initialize the scheduling service.
         
         Args:
             excel_path: Path to Excel file containing classrooms and availability
             course_config_path: Path to JSON file containing course configuration
+            workers: Number of processes; above 1 a portfolio of solvers runs in parallel
         """
         self.excel_path = excel_path
         self.course_config_path = course_config_path
+        self.workers = workers
+
+        # Informe del chequeo previo de la última ejecución (ver presolve.py)
+        self.presolve_report = None
+
+        # Grupos que quedaron sin colocar en un resultado parcial
+        self.unplaced = []
+
+        # Grupos que cambiaron de lugar respecto del horario anterior
+        self.moved = []
 
-    def run(self):
+    def run(
+        self,
+        allow_partial: bool = False,
+        time_limit: float | None = None,
+        previous: dict | None = None
+    ):
+        """
+        Build and solve the schedule.
+
+        Args:
+            allow_partial: When no complete schedule is found, return the
+                largest placement found instead of None. The group ids left
+                out are stored in `unplaced`.
+            time_limit: Seconds allowed for the complete search.
+            previous: Assignments of an earlier run. Every one that still
+                fits the current inputs is kept and only the neighbourhood
+                of the changes is rescheduled; the group ids that moved are
+                stored in `moved`.
+        """
         # 1. Load infrastructure data
         excel_reader = ExcelReader(self.excel_path)
         course_reader = CourseConfigReader(self.course_config_path)
@@ -34,7 +69,8 @@ class SchedulingService:
 
         schedule_state = ScheduleState(
             time_model=time_model,
-            classrooms=list(classrooms.values())
+            classrooms=list(classrooms.values()),
+            vectorized=True
         )
 
         for (classroom_name, day, hour), available in availability.items():
@@ -49,9 +85,37 @@ class SchedulingService:
         for course in courses:
             groups.extend(course.generate_groups())
 
-        # 3. Run scheduler
-        scheduler = Scheduler()
-        success = scheduler.schedule(schedule_state, groups)
+        # 3. Run scheduler: cada grupo de aulas independiente por separado
+        # (primer ajuste; backtracking sólo si hace falta)
+        if self.workers > 1:
+            make_solver = partial(PortfolioScheduler, workers=self.workers)
+        else:
+            make_solver = GreedyScheduler
+
+        self.unplaced = []
+        self.moved = []
+
+        if previous is not None:
+            # Reparación local del horario anterior en vez de empezar de cero
+            scheduler = IncrementalScheduler(make_solver)
+            success = scheduler.schedule(schedule_state, groups, previous, time_limit=time_limit)
+            self.moved = scheduler.moved
+        else:
+            scheduler = DecomposedScheduler(make_solver)
+            success = scheduler.schedule(schedule_state, groups, time_limit=time_limit)
+
+        self.presolve_report = scheduler.presolve_report
 
         # 4. Return result
-        return schedule_state.assignments if success else None
\ No newline at end of file
+        if success:
+            return schedule_state.assignments
+
+        if not allow_partial:
+            return None
+
+        # Mejor colocación parcial en lugar de nada
+        repair = PartialScheduler()
+        repair.schedule(schedule_state, groups, time_limit=time_limit)
+        self.unplaced = [g.group_id for g in repair.unplaced]
+
+        return schedule_state.assignments
@@ -212,12 +212,35 @@ class MainWindow(QMainWindow):
 
             # Run scheduling service
             service = SchedulingService(self.excel_path, temp_config.name)
-            assignments = service.run()
+            assignments = service.run(allow_partial=True, time_limit=60)
 
             # Clean up temp file
             Path(temp_config.name).unlink()
 
-            if assignments:
+            if assignments and service.unplaced:
+                self.current_schedule = assignments
+                self.schedule_viewer.display_schedule(assignments, self.time_model)
+                self.tabs.setCurrentIndex(1)  # Switch to schedule viewer tab
+                self.btn_export.setEnabled(True)
+                self.status_bar.showMessage(
+                    f"⚠️ Horario parcial ({len(assignments)} asignaciones, "
+                    f"{len(service.unplaced)} grupos sin asignar)"
+                )
+
+                details = ""
+                report = service.presolve_report
+                if report is not None and not report.feasible:
+                    details = f"\n\nFaltan recursos por tipo de aula:\n{report}"
+
+                QMessageBox.warning(
+                    self,
+                    "Horario parcial",
+                    f"No se pudieron asignar todos los grupos.\n\n"
+                    f"Total de asignaciones: {len(assignments)}\n"
+                    f"Grupos sin asignar: {', '.join(service.unplaced)}"
+                    f"{details}"
+                )
+            elif assignments:
                 self.current_schedule = assignments
                 self.schedule_viewer.display_schedule(assignments, self.time_model)
                 self.tabs.setCurrentIndex(1)  # Switch to schedule viewer tab
@@ -234,6 +257,18 @@ class MainWindow(QMainWindow):
                 )
             else:
                 self.status_bar.showMessage("❌ No se pudo generar el horario")
+
+                report = service.presolve_report
+                if report is not None and not report.feasible:
+                    QMessageBox.warning(
+                        self,
+                        "Error",
+                        "No se pudo generar un horario válido.\n\n"
+                        "Faltan recursos por tipo de aula:\n"
+                        f"{report}"
+                    )
+                    return
+
                 QMessageBox.warning(
                     self,
                     "Error",
@@ -8,22 +8,26 @@ class Classroom:
         self.room_type = room_type
         self.time_model = time_model
 
-        # Ocupación: (day_index, block_index) -> bool
+        # Ocupación: day_index -> bitmask (bit b encendido = bloque b ocupado)
         self.occupancy = {}
 
+    @staticmethod
+    def _run_mask(start_block: int, duration: int) -> int:
+        return ((1 << duration) - 1) << start_block
+
     def is_available(self, day: int, start_block: int, duration: int) -> bool:
-        for i in range(duration):
-            key = (day, start_block + i)
-            if self.occupancy.get(key, False):
-                return False
-        return True
+        return not self.occupancy.get(day, 0) & self._run_mask(start_block, duration)
 
     def occupy(self, day: int, start_block: int, duration: int):
-        for i in range(duration):
-            key = (day, start_block + i)
-            self.occupancy[key] = True
+        self.occupancy[day] = self.occupancy.get(day, 0) | self._run_mask(start_block, duration)
 
     def release(self, day: int, start_block: int, duration: int):
-        for i in range(duration):
-            key = (day, start_block + i)
-            self.occupancy[key] = False
\ No newline at end of file
+        mask = self.occupancy.get(day, 0) & ~self._run_mask(start_block, duration)
+
+        if mask:
+            self.occupancy[day] = mask
+        else:
+            self.occupancy.pop(day, None)
+
+    def is_occupied(self, day: int, block: int) -> bool:
+        return bool(self.occupancy.get(day, 0) >> block & 1)
@@ -0,0 +1,94 @@
+# src/scheduling/compiled.py
+
+from typing import List
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .schedule_state import ScheduleState
+from .group import Group
+
+
+class CompiledProblem:
+    """
+    Integer-indexed snapshot of a scheduling instance.
+
+    Rooms and groups become positions in parallel arrays, room types become
+    type ids, and every (room, day, block) cell becomes one integer:
+
+        cell = (room * days + day - 1) * blocks + block - 1
+
+    so the blocks of a run are consecutive cells. A group's candidate slots
+    are the cells where a free run of its duration starts. Solvers work on
+    these ids and map back to `(classroom_name, day, block)` with `slot`.
+    The snapshot does not follow later changes to the state.
+    """
+
+    def __init__(self, state: ScheduleState, groups: List[Group]):
+        self.days = state.time_model.days_count
+        self.blocks = state.time_model.blocks_per_day
+
+        self.room_names = list(state.classrooms)
+        classrooms = [state.classrooms[name] for name in self.room_names]
+
+        self.type_ids = {}
+        for room_type in [c.room_type for c in classrooms] + [g.required_room_type for g in groups]:
+            self.type_ids.setdefault(room_type, len(self.type_ids))
+
+        self.room_type = np.array([self.type_ids[c.room_type] for c in classrooms], dtype=np.int32)
+        self.capacity = np.array([c.capacity for c in classrooms], dtype=np.int32)
+
+        self.groups = list(groups)
+        self.group_index = {g.group_id: i for i, g in enumerate(self.groups)}
+        self.group_type = np.array([self.type_ids[g.required_room_type] for g in groups], dtype=np.int32)
+        self.duration = np.array([g.duration for g in groups], dtype=np.int32)
+        self.size = np.array([g.size for g in groups], dtype=np.int32)
+
+        # Ocupación fija: aulas x días x bloques (True = ocupado)
+        if state.vectorized:
+            self.busy = state.grid.copy()
+        else:
+            bits = np.arange(1, self.blocks + 1, dtype=np.int64)
+            self.busy = np.zeros((len(classrooms), self.days, self.blocks), dtype=bool)
+
+            for i, classroom in enumerate(classrooms):
+                for day, mask in classroom.occupancy.items():
+                    if 1 <= day <= self.days:
+                        self.busy[i, day - 1] = (mask >> bits) & 1
+
+        self._starts = {}
+
+    def rooms(self, g: int) -> np.ndarray:
+        """Ids of the rooms group `g` fits in (same type, enough capacity)."""
+        return np.flatnonzero((self.room_type == self.group_type[g]) & (self.capacity >= self.size[g]))
+
+    def starts(self, g: int) -> list:
+        """Cells where group `g` can start, shared between groups with the same needs."""
+        key = (self.group_type[g], self.duration[g], self.size[g])
+
+        if key not in self._starts:
+            self._starts[key] = self._feasible_starts(self.rooms(g), int(self.duration[g]))
+
+        return self._starts[key]
+
+    def _feasible_starts(self, rooms: np.ndarray, duration: int) -> list:
+
+        count = self.blocks - duration + 1
+        if count <= 0 or duration <= 0 or len(rooms) == 0:
+            return []
+
+        free = ~sliding_window_view(self.busy[rooms], duration, axis=2).any(axis=-1)
+        room, day, block = np.nonzero(free)
+
+        cells = (rooms[room] * self.days + day) * self.blocks + block
+        return cells.tolist()
+
+    def slot(self, cell: int) -> tuple:
+        """Inverse of the cell numbering: `(classroom_name, day, block)`."""
+        room, rest = divmod(cell, self.days * self.blocks)
+        day, block = divmod(rest, self.blocks)
+        return self.room_names[room], day + 1, block + 1
+
+    def to_assignments(self, starts: dict) -> dict:
+        """Map `{group index: start cell}` to the `assignments` format."""
+        return {self.groups[g].group_id: self.slot(cell) for g, cell in starts.items()}
@@ -0,0 +1,66 @@
+# src/scheduling/conflict_index.py
+
+from collections import defaultdict
+
+
+class ConflictIndex:
+
+    def __init__(self):
+        # (classroom_name, day, block) -> [(grupos que comparten dominio base, posición), ...]
+        self._cells = defaultdict(list)
+
+        # Valores vivos de grupos sin asignar que cubren cada celda
+        self.load = defaultdict(int)
+
+    @classmethod
+    def from_groups(cls, groups) -> "ConflictIndex":
+        """
+        Index each shared base domain once; groups whose SparseDomain points
+        at the same `values` list share every entry.
+        """
+        members = {}
+        for group in groups:
+            members.setdefault(id(group.domain.values), []).append(group)
+
+        index = cls()
+        for sharing in members.values():
+            for position, value in enumerate(sharing[0].domain.values):
+                index.add(sharing, position, value)
+        return index
+
+    def add(self, groups: list, position: int, value) -> None:
+        classroom, day, start_block = value
+        for block in range(start_block, start_block + groups[0].duration):
+            self._cells[(classroom.name, day, block)].append((groups, position))
+            self.load[(classroom.name, day, block)] += len(groups)
+
+    def adjust(self, value, duration: int, delta: int) -> None:
+        classroom, day, start_block = value
+        load = self.load
+        for block in range(start_block, start_block + duration):
+            load[(classroom.name, day, block)] += delta
+
+    def pressure(self, value, duration: int) -> int:
+        """
+        Weighted-overlap estimate of how constraining the given run is: the
+        sum of cell loads over its blocks. A competing value that shares k
+        cells with the run counts k times, so it is an upper bound on the
+        number of live values the run would remove. It costs O(duration) per
+        candidate, which keeps LCV sorting cheap.
+        """
+        classroom, day, start_block = value
+        load = self.load
+        return sum(
+            load.get((classroom.name, day, block), 0)
+            for block in range(start_block, start_block + duration)
+        )
+
+    def covering(self, classroom_name: str, day: int, block: int):
+        for groups, position in self._cells.get((classroom_name, day, block), ()):
+            for group in groups:
+                yield group, position
+
+    def overlapping(self, classroom_name: str, day: int, start_block: int, duration: int):
+        """Yield every indexed (group, position) whose run intersects the given run."""
+        for block in range(start_block, start_block + duration):
+            yield from self.covering(classroom_name, day, block)
@@ -0,0 +1,186 @@
+# src/scheduling/decomposition.py
+
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, List, Optional
+
+from .schedule_state import ScheduleState
+from .group import Group
+from .greedy import GreedyScheduler
+from .presolve import presolve
+
+
+def components(state: ScheduleState, groups: List[Group]) -> list:
+    """
+    Split the problem into independent subproblems.
+
+    A group is linked to every classroom it fits in (same type, enough
+    capacity); each connected component of that graph is returned as a
+    `(classroom_names, groups)` pair. Groups of different components never
+    compete for a room. A group that fits nowhere forms its own component
+    with no rooms.
+    """
+    parent = {}
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(a, b):
+        parent[find(a)] = find(b)
+
+    for name in state.classrooms:
+        parent[("room", name)] = ("room", name)
+
+    for group in groups:
+        node = ("group", group.group_id)
+        parent[node] = node
+
+        for classroom in state.classrooms.values():
+            if classroom.room_type == group.required_room_type and classroom.capacity >= group.size:
+                union(node, ("room", classroom.name))
+
+    rooms_of = {}
+    groups_of = {}
+
+    for name in state.classrooms:
+        rooms_of.setdefault(find(("room", name)), []).append(name)
+    for group in groups:
+        groups_of.setdefault(find(("group", group.group_id)), []).append(group)
+
+    # Las aulas que ningún grupo puede usar no forman subproblema
+    return [(rooms_of.get(root, []), members) for root, members in groups_of.items()]
+
+
+def _solve(state, groups, make_solver, time_limit, stop):
+    """Worker entry point: solve one component and return plain results."""
+    solver = make_solver()
+
+    success = solver.schedule(state, groups, time_limit=time_limit, should_stop=stop.is_set)
+
+    assignments = {g.group_id: g.assignment for g in groups if g.assignment is not None}
+    return success, solver.status, assignments
+
+
+class DecomposedScheduler:
+    """
+    Solves each independent component (see `components`) on its own, so a
+    failure among LAB groups never backtracks through REGULAR assignments.
+
+    With `workers` above 1 the components are solved in parallel processes on
+    copies of their own classrooms, and the assignments are replayed into
+    the caller's state. `make_solver` builds the solver used per component;
+    it must be picklable for parallel runs and its `schedule` must accept
+    `time_limit` and `should_stop`.
+    """
+
+    def __init__(self, make_solver: Callable = GreedyScheduler, workers: int = 1):
+        self.make_solver = make_solver
+        self.workers = workers
+
+        self.status = None
+        self.presolve_report = None
+        self.components = []
+
+    def schedule(
+        self,
+        state: ScheduleState,
+        groups: List[Group],
+        time_limit: Optional[float] = None
+    ) -> bool:
+
+        self.presolve_report = presolve(state, groups)
+        if not self.presolve_report.feasible:
+            self.status = "infeasible"
+            return False
+
+        pending = [g for g in groups if not g.is_assigned()]
+
+        # Primero los subproblemas chicos: si alguno falla, se sabe antes
+        self.components = sorted(components(state, pending), key=lambda c: len(c[1]))
+
+        if self.workers > 1 and len(self.components) > 1:
+            success = self._solve_parallel(state, time_limit)
+        else:
+            success = self._solve_sequential(state, time_limit)
+
+        if success:
+            self.status = "solved"
+            return True
+
+        # Un resultado fallido deja el estado como estaba
+        for group in pending:
+            if group.is_assigned():
+                state.unassign(group)
+
+        return False
+
+    def _solve_sequential(self, state, time_limit) -> bool:
+
+        deadline = None if time_limit is None else time.monotonic() + time_limit
+
+        for _, members in self.components:
+            remaining = None
+            if deadline is not None:
+                remaining = max(deadline - time.monotonic(), 0)
+
+            solver = self.make_solver()
+            if not solver.schedule(state, members, time_limit=remaining):
+                self.status = solver.status
+                return False
+
+        return True
+
+    def _solve_parallel(self, state, time_limit) -> bool:
+
+        with multiprocessing.Manager() as manager:
+            stop = manager.Event()
+
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(self.components))) as pool:
+                futures = []
+
+                for names, members in self.components:
+                    substate = ScheduleState(
+                        state.time_model,
+                        [state.classrooms[name] for name in names],
+                        vectorized=state.vectorized
+                    )
+                    futures.append(pool.submit(_solve, substate, members, self.make_solver, time_limit, stop))
+
+                results = self._collect(futures)
+                stop.set()
+
+                for future in futures:
+                    future.cancel()
+
+        if results is None:
+            return False
+
+        by_id = {g.group_id: g for _, members in self.components for g in members}
+        for group_id, (classroom_name, day, block) in results.items():
+            state.assign(by_id[group_id], classroom_name, day, block)
+
+        return True
+
+    def _collect(self, futures: list):
+
+        merged = {}
+        pending = set(futures)
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                success, status, assignments = future.result()
+
+                # Basta un subproblema sin solución para que falle todo
+                if not success:
+                    self.status = status
+                    return None
+
+                merged.update(assignments)
+
+        return merged
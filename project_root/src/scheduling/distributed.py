@@ -0,0 +1,243 @@
+# src/scheduling/distributed.py
+
+import queue
+import threading
+import time
+from multiprocessing.connection import Client, Listener, wait
+from typing import List, Optional
+
+from .schedule_state import ScheduleState
+from .group import Group
+from .scheduler import Scheduler
+from .parallel_search import ParallelScheduler
+from .presolve import presolve
+
+
+# Mensajes del protocolo (tuplas serializadas por Connection.send):
+#   coordinador -> trabajador: ("problem", state, groups, options, split_nodes)
+#                              ("task", task_id, prefix, time_limit)
+#                              ("steal",)  ("stop",)
+#   trabajador -> coordinador: ("result", task_id, success, status, assignments)
+
+
+def work(address, authkey: Optional[bytes] = None):
+    """
+    Worker loop: connect to a coordinator, receive the problem once and
+    solve the subtrees it hands out until told to stop. Runs on any machine
+    that can reach `address`.
+    """
+    conn = Client(address, authkey=authkey)
+
+    try:
+        _, state, groups, options, split_nodes = conn.recv()
+        by_id = {g.group_id: g for g in groups}
+
+        while True:
+            message = conn.recv()
+
+            if message[0] == "stop":
+                return
+            if message[0] != "task":
+                # Pedido de robo que llegó con el trabajador ya libre
+                continue
+
+            _, task_id, prefix, time_limit = message
+            interrupted = []
+
+            def should_stop():
+                if interrupted or not conn.poll():
+                    return bool(interrupted)
+                interrupted.append(conn.recv()[0])
+                return True
+
+            success, status = _solve_prefix(
+                state, groups, by_id, prefix, options, split_nodes, time_limit, should_stop
+            )
+            assignments = {g.group_id: g.assignment for g in groups if g.assignment is not None}
+
+            for group in groups:
+                if group.is_assigned():
+                    state.unassign(group)
+
+            if interrupted and interrupted[0] == "stop":
+                return
+
+            conn.send(("result", task_id, success, status, assignments))
+
+    except (EOFError, OSError):
+        # El coordinador cerró la conexión
+        return
+
+    finally:
+        conn.close()
+
+
+def _solve_prefix(state, groups, by_id, prefix, options, node_limit, time_limit, should_stop):
+
+    for group_id, (classroom_name, day, block) in prefix:
+        if not state.assign(by_id[group_id], classroom_name, day, block):
+            return False, "infeasible"
+
+    solver = Scheduler(**options)
+    rest = [g for g in groups if not g.is_assigned()]
+
+    success = solver.schedule(
+        state, rest, time_limit=time_limit, node_limit=node_limit, should_stop=should_stop
+    )
+    return success, solver.status
+
+
+class Coordinator(ParallelScheduler):
+    """
+    Distributes the subtrees of `ParallelScheduler` to workers connected
+    over TCP (`multiprocessing.connection`, authenticated with `authkey`).
+
+    Workers run `work(coordinator.address, authkey)` and may join at any
+    time while `schedule` runs. The problem is sent once per worker; after
+    that each task is only a prefix of fixed assignments. A subtree that
+    runs out of nodes comes back and is split. When the queue is empty and
+    a worker sits idle, a busy worker is asked to give its subtree back
+    ("steal"), which is split the same way. One `schedule` call per
+    coordinator: the listener is closed at the end.
+    """
+
+    def __init__(
+        self,
+        address=("localhost", 0),
+        authkey: Optional[bytes] = None,
+        split_nodes: int = 5000,
+        tasks_per_worker: int = 4,
+        **options
+    ):
+        super().__init__(workers=1, split_nodes=split_nodes, tasks_per_worker=tasks_per_worker, **options)
+
+        self._listener = Listener(address, authkey=authkey)
+        self.address = self._listener.address
+
+        self.connected = 0
+        self.steals = 0
+
+    def schedule(
+        self,
+        state: ScheduleState,
+        groups: List[Group],
+        time_limit: Optional[float] = None
+    ) -> bool:
+
+        try:
+            self.presolve_report = presolve(state, groups)
+            if not self.presolve_report.feasible:
+                self.status = "infeasible"
+                return False
+
+            deadline = None if time_limit is None else time.monotonic() + time_limit
+            pending = [g for g in groups if not g.is_assigned()]
+
+            self.tasks = 0
+            self.splits = 0
+            self.steals = 0
+
+            # Pila: los hijos de un subárbol dividido se reparten antes que sus hermanos
+            tasks = list(reversed(self._expand(state, pending, self.tasks_per_worker)))
+            result = self._serve(state, pending, tasks, deadline)
+
+            return self._replay(state, pending, result)
+
+        finally:
+            self._listener.close()
+
+    def _accept(self, arrivals: queue.Queue):
+
+        while True:
+            try:
+                arrivals.put(self._listener.accept())
+            except (OSError, EOFError):
+                return
+
+    def _serve(self, state, groups, tasks, deadline):
+
+        arrivals = queue.Queue()
+        threading.Thread(target=self._accept, args=(arrivals,), daemon=True).start()
+
+        workers = []
+        busy = {}
+        stealing = set()
+        prefixes = {}
+        unresolved = False
+        result = None
+
+        try:
+            while tasks or busy:
+                if deadline is not None and time.monotonic() >= deadline:
+                    unresolved = True
+                    break
+
+                while not arrivals.empty():
+                    conn = arrivals.get()
+                    conn.send(("problem", state, groups, self.options, self.split_nodes))
+                    workers.append(conn)
+                    self.connected += 1
+
+                # Reparto: primero la cola; si se vació, se le roba a un ocupado
+                for conn in workers:
+                    if conn in busy:
+                        continue
+
+                    if tasks:
+                        time_limit = None
+                        if deadline is not None:
+                            time_limit = max(deadline - time.monotonic(), 0)
+
+                        task_id = self.tasks
+                        self.tasks += 1
+                        prefixes[task_id] = tasks.pop()
+                        busy[conn] = task_id
+                        conn.send(("task", task_id, prefixes[task_id], time_limit))
+
+                    else:
+                        victims = [c for c in busy if c not in stealing]
+                        if victims:
+                            victims[0].send(("steal",))
+                            stealing.add(victims[0])
+                            self.steals += 1
+
+                if not busy:
+                    # Nadie trabajando todavía: se espera a que se conecte alguien
+                    time.sleep(0.01)
+                    continue
+
+                for conn in wait(list(busy), timeout=0.05):
+                    try:
+                        _, task_id, success, status, assignments = conn.recv()
+                    except (EOFError, OSError):
+                        # Trabajador caído: su subárbol vuelve a la cola
+                        workers.remove(conn)
+                        stealing.discard(conn)
+                        tasks.append(prefixes.pop(busy.pop(conn)))
+                        continue
+
+                    del busy[conn]
+                    stealing.discard(conn)
+                    prefix = prefixes.pop(task_id)
+
+                    if success:
+                        result = assignments
+                        return result
+
+                    # Subárbol sin terminar (nodos agotados o robado): se divide
+                    if status == "budget":
+                        self.splits += 1
+                        tasks.extend(reversed(self._split(state, groups, prefix)))
+
+        finally:
+            for conn in workers:
+                try:
+                    conn.send(("stop",))
+                    conn.close()
+                except OSError:
+                    pass
+
+            if result is None:
+                self.status = "budget" if tasks or busy or unresolved else "infeasible"
+
+        return None
@@ -0,0 +1,123 @@
+# src/scheduling/greedy.py
+
+import time
+from typing import Callable, List, Optional
+
+from .schedule_state import ScheduleState
+from .group import Group
+from .scheduler import Scheduler
+from .presolve import presolve
+
+
+class GreedyScheduler:
+    """
+    First-fit-decreasing construction with a complete fallback.
+
+    Groups are placed longest first and, among equal durations, the ones
+    with fewer compatible rooms first, each in the first free (room, day,
+    block) found with `Classroom.is_available`. Rooms are tried smallest
+    first so large rooms stay free for large groups. Groups left over are
+    handed to the backtracker with the greedy placements fixed; if that
+    fails, the greedy placements are dropped and the backtracker solves
+    everything from scratch.
+    """
+
+    def __init__(self, fallback: Optional[Scheduler] = None):
+        self.fallback = fallback or Scheduler()
+
+        self.status = None
+        self.presolve_report = None
+        self.placed = 0
+
+    def schedule(
+        self,
+        state: ScheduleState,
+        groups: List[Group],
+        time_limit: Optional[float] = None,
+        node_limit: Optional[int] = None,
+        should_stop: Optional[Callable[[], bool]] = None
+    ) -> bool:
+
+        deadline = None if time_limit is None else time.monotonic() + time_limit
+
+        if self.fallback.presolve:
+            self.presolve_report = presolve(state, groups)
+            if not self.presolve_report.feasible:
+                self.status = "infeasible"
+                return False
+
+        pending = [g for g in groups if not g.is_assigned()]
+        placed, unplaced = self._first_fit(state, pending)
+        self.placed = len(placed)
+
+        if not unplaced:
+            self.status = "solved"
+            return True
+
+        # Sólo los grupos que no entraron, con lo colocado fijo
+        if self._fallback(state, unplaced, deadline, node_limit, should_stop):
+            return True
+
+        for group in placed:
+            state.unassign(group)
+
+        if self.status == "budget":
+            return False
+
+        return self._fallback(state, pending, deadline, node_limit, should_stop)
+
+    def _first_fit(self, state: ScheduleState, groups: List[Group]):
+
+        rooms = sorted(state.classrooms.values(), key=lambda c: (c.capacity, c.name))
+
+        fitting = {}
+        for group in groups:
+            need = (group.required_room_type, group.size)
+            if need not in fitting:
+                fitting[need] = [
+                    c for c in rooms
+                    if c.room_type == group.required_room_type and c.capacity >= group.size
+                ]
+
+        order = sorted(
+            groups,
+            key=lambda g: (-g.duration, len(fitting[(g.required_room_type, g.size)]))
+        )
+
+        days = state.time_model.days_count
+        blocks = state.time_model.blocks_per_day
+
+        placed = []
+        unplaced = []
+
+        for group in order:
+            if self._place(state, group, fitting[(group.required_room_type, group.size)], days, blocks):
+                placed.append(group)
+            else:
+                unplaced.append(group)
+
+        return placed, unplaced
+
+    @staticmethod
+    def _place(state, group, rooms, days: int, blocks: int) -> bool:
+
+        for classroom in rooms:
+            for day in range(1, days + 1):
+                for block in range(1, blocks - group.duration + 2):
+                    if classroom.is_available(day, block, group.duration):
+                        return state.assign(group, classroom.name, day, block)
+
+        return False
+
+    def _fallback(self, state, groups, deadline, node_limit, should_stop) -> bool:
+
+        time_limit = None
+        if deadline is not None:
+            time_limit = max(deadline - time.monotonic(), 0)
+
+        result = self.fallback.schedule(
+            state, groups, time_limit=time_limit, node_limit=node_limit, should_stop=should_stop
+        )
+        self.status = self.fallback.status
+
+        return result
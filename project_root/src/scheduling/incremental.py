@@ -0,0 +1,153 @@
+# src/scheduling/incremental.py
+
+import time
+from typing import List, Optional
+
+from .schedule_state import ScheduleState
+from .group import Group
+from .greedy import GreedyScheduler
+from .decomposition import components
+
+
+class IncrementalScheduler:
+    """
+    Repairs a previous schedule after a small change instead of solving
+    again from scratch.
+
+    The change set is read from the inputs: groups missing from `previous`
+    were added, ids of `previous` missing from `groups` were removed, and
+    `blocked` lists (classroom_name, day, block) cells that are no longer
+    available. Every surviving assignment that still fits is kept; the rest
+    of the groups are displaced and placed again with the kept ones fixed.
+
+    When that fails, kept groups are released in widening rings and placed
+    again together with the displaced ones:
+
+        1. groups on the same days in rooms the displaced groups can use
+           (every day, if one of them is new);
+        2. every group competing for those rooms (see `components`);
+        3. everything.
+
+    `moved` lists the surviving groups whose slot changed. On failure the
+    kept assignments are left in the state, so a partial repair can build
+    on them.
+    """
+
+    def __init__(self, make_solver=GreedyScheduler):
+        self.make_solver = make_solver
+
+        self.status = None
+        self.presolve_report = None
+
+        self.added = []
+        self.removed = []
+        self.displaced = []
+        self.moved = []
+        self.ring = None
+
+    def schedule(
+        self,
+        state: ScheduleState,
+        groups: List[Group],
+        previous: dict,
+        blocked=(),
+        time_limit: Optional[float] = None
+    ) -> bool:
+
+        deadline = None if time_limit is None else time.monotonic() + time_limit
+        previous = {group_id: tuple(slot) for group_id, slot in previous.items()}
+
+        for classroom_name, day, block in blocked:
+            state.classrooms[classroom_name].occupy(day, block, 1)
+        if blocked and state.vectorized:
+            state.refresh_grid()
+
+        ids = {g.group_id for g in groups}
+        self.added = [g.group_id for g in groups if g.group_id not in previous]
+        self.removed = [group_id for group_id in previous if group_id not in ids]
+
+        kept = []
+        displaced = []
+
+        for group in groups:
+            if group.is_assigned():
+                continue
+
+            slot = previous.get(group.group_id)
+            if slot is not None and state.assign(group, *slot):
+                kept.append(group)
+            else:
+                displaced.append(group)
+
+        self.displaced = [g.group_id for g in displaced]
+
+        released = []
+        success = False
+
+        for self.ring, ring in enumerate(self._rings(state, groups, kept, displaced, previous)):
+            fresh = [g for g in ring if g.is_assigned()]
+
+            # Un anillo que no libera a nadie nuevo no cambia el problema
+            if self.ring and not fresh:
+                continue
+
+            for group in fresh:
+                state.unassign(group)
+            released += fresh
+
+            remaining = None
+            if deadline is not None:
+                remaining = max(deadline - time.monotonic(), 0)
+
+            solver = self.make_solver()
+            success = solver.schedule(state, displaced + released, time_limit=remaining)
+
+            self.status = solver.status
+            self.presolve_report = solver.presolve_report
+
+            if success or self.status == "budget":
+                break
+
+        if not success:
+            # Se vuelve al punto de partida: lo conservado sigue en su lugar
+            for group in released:
+                state.assign(group, *previous[group.group_id])
+
+        self.moved = [
+            g.group_id for g in groups
+            if g.group_id in previous and g.assignment != previous[g.group_id]
+        ]
+
+        return success
+
+    @staticmethod
+    def _rings(state, groups, kept, displaced, previous):
+
+        yield []
+        if not displaced:
+            return
+
+        # Aulas que los desplazados pueden usar
+        rooms = {
+            c.name for c in state.classrooms.values()
+            for g in displaced
+            if c.room_type == g.required_room_type and c.capacity >= g.size
+        }
+
+        days = {previous[g.group_id][1] for g in displaced if g.group_id in previous}
+        if any(g.group_id not in previous for g in displaced):
+            days = set(range(1, state.time_model.days_count + 1))
+
+        yield [
+            g for g in kept
+            if previous[g.group_id][0] in rooms and previous[g.group_id][1] in days
+        ]
+
+        # Grupos que compiten por esas aulas
+        related = set()
+        for names, members in components(state, groups):
+            if rooms.intersection(names):
+                related.update(members)
+
+        yield [g for g in kept if g in related]
+        yield kept
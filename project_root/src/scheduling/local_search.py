@@ -0,0 +1,191 @@
+# src/scheduling/local_search.py
+
+import random
+import time
+from typing import Callable, List, Optional
+
+from .schedule_state import ScheduleState
+from .group import Group
+from .compiled import CompiledProblem
+
+
+class LocalSearchScheduler:
+    """
+    Min-conflicts local search. Every group always holds a slot, overlaps
+    allowed, and each step moves the most conflicted group to the slot that
+    overlaps the fewest others. Recently left slots are tabu for `tabu_tenure`
+    steps and, with probability `walk_probability`, a random conflicted group
+    takes a random slot instead.
+
+    The search runs on a `CompiledProblem`: groups are indices and slots are
+    integer cells. Only a conflict-free result is written to the state (through
+    `ScheduleState.assign`), so a failed run leaves it untouched. Local search
+    cannot prove infeasibility: on failure `status` is always "budget".
+    """
+
+    def __init__(
+        self,
+        max_steps: int = 100000,
+        tabu_tenure: int = 10,
+        walk_probability: float = 0.02,
+        seed: Optional[int] = None
+    ):
+        self.max_steps = max_steps
+        self.tabu_tenure = tabu_tenure
+        self.walk_probability = walk_probability
+        self.seed = seed
+
+        self.status = None
+        self.steps = 0
+
+    def schedule(
+        self,
+        state: ScheduleState,
+        groups: List[Group],
+        time_limit: Optional[float] = None,
+        should_stop: Optional[Callable[[], bool]] = None
+    ) -> bool:
+
+        deadline = None if time_limit is None else time.monotonic() + time_limit
+        rng = random.Random(self.seed)
+        self.steps = 0
+
+        groups = [g for g in groups if not g.is_assigned()]
+        problem = CompiledProblem(state, groups)
+        candidates = [problem.starts(g) for g in range(len(groups))]
+
+        if any(not slots for slots in candidates):
+            self.status = "infeasible"
+            return False
+
+        # Celda -> índices de los grupos que la usan en la solución tentativa
+        self._cells = {}
+        self._slot = {}
+        self._duration = problem.duration.tolist()
+        self._conflicts = {}
+        self._conflicted = {}
+
+        # Construcción voraz: primero los grupos con menos opciones
+        for group in sorted(range(len(groups)), key=lambda g: len(candidates[g])):
+            self._place(group, self._best(group, candidates[group], {}, rng))
+
+        tabu = {}
+
+        while self._conflicted:
+            if self.steps >= self.max_steps:
+                break
+            if self.steps % 64 == 0:
+                if deadline is not None and time.monotonic() >= deadline:
+                    break
+                if should_stop is not None and should_stop():
+                    break
+
+            self.steps += 1
+
+            walk = rng.random() < self.walk_probability
+            if walk:
+                group = rng.choice(list(self._conflicted))
+            else:
+                group = self._most_conflicted(rng)
+
+            # Se retira antes de evaluar, para no contar sus propios choques
+            previous = self._slot[group]
+            self._remove(group)
+
+            if walk:
+                slot = rng.choice(candidates[group])
+            else:
+                slot = self._best(group, candidates[group], tabu, rng)
+
+            self._place(group, slot)
+
+            if slot != previous:
+                tabu[(group, previous)] = self.steps + self.tabu_tenure
+
+        if self._conflicted:
+            self.status = "budget"
+            return False
+
+        for group, cell in self._slot.items():
+            state.assign(groups[group], *problem.slot(cell))
+
+        self.status = "solved"
+        return True
+
+    def _cost(self, group: int, start: int) -> int:
+        cells = self._cells
+        return sum(len(cells.get(cell, ())) for cell in range(start, start + self._duration[group]))
+
+    def _best(self, group, slots, tabu, rng):
+
+        best = []
+        best_cost = None
+
+        # Recorrido desde un punto al azar; un hueco sin choques se toma de inmediato
+        offset = rng.randrange(len(slots))
+
+        for i in range(len(slots)):
+            slot = slots[(offset + i) % len(slots)]
+            cost = self._cost(group, slot)
+
+            if not cost:
+                return slot
+
+            # Un valor tabú sólo se acepta si no choca con nadie (aspiración)
+            if tabu.get((group, slot), 0) > self.steps:
+                continue
+
+            if best_cost is None or cost < best_cost:
+                best, best_cost = [slot], cost
+            elif cost == best_cost:
+                best.append(slot)
+
+        if not best:
+            return rng.choice(slots)
+
+        return rng.choice(best)
+
+    def _most_conflicted(self, rng):
+
+        conflicts = self._conflicts
+        worst = max(conflicts[g] for g in self._conflicted)
+        return rng.choice([g for g in self._conflicted if conflicts[g] == worst])
+
+    def _place(self, group: int, start: int):
+
+        self._slot[group] = start
+        self._conflicts[group] = 0
+
+        for cell in range(start, start + self._duration[group]):
+            occupants = self._cells.setdefault(cell, [])
+
+            for other in occupants:
+                self._bump(other, 1)
+                self._bump(group, 1)
+
+            occupants.append(group)
+
+    def _remove(self, group: int):
+
+        start = self._slot.pop(group)
+
+        for cell in range(start, start + self._duration[group]):
+            occupants = self._cells[cell]
+            occupants.remove(group)
+
+            for other in occupants:
+                self._bump(other, -1)
+                self._bump(group, -1)
+
+            if not occupants:
+                del self._cells[cell]
+
+    def _bump(self, group: int, delta: int):
+
+        count = self._conflicts[group] + delta
+        self._conflicts[group] = count
+
+        if count:
+            self._conflicted[group] = None
+        else:
+            self._conflicted.pop(group, None)
@@ -0,0 +1,68 @@
+# src/scheduling/nogood_store.py
+
+class NogoodStore:
+    """
+    Learned nogoods: sets of (group, domain position) assignments that were
+    proved not to extend to a full schedule.
+
+    Each nogood watches one literal that is currently false. Only assigning
+    the watched literal can complete the nogood, so a new assignment looks at
+    the nogoods watching it and either moves the watch to another false
+    literal or reports a violation. Undoing assignments never invalidates a
+    watch, so nothing has to be restored on backtrack.
+    """
+
+    def __init__(self, max_size: int = 12, capacity: int = 20000):
+        self.max_size = max_size
+        self.capacity = capacity
+        self._watches = {}
+        self._seen = set()
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def learn(self, literals, watch) -> bool:
+        """Store a nogood watched on `watch`, a literal about to become false."""
+        nogood = tuple(literals)
+        key = frozenset(nogood)
+
+        if not nogood or len(nogood) > self.max_size:
+            return False
+        if key in self._seen or len(self._seen) >= self.capacity:
+            return False
+
+        self._seen.add(key)
+        self._watches.setdefault(watch, []).append(nogood)
+
+        return True
+
+    def violated(self, group, position: int, holds):
+        """
+        Return the other groups of a nogood made true by assigning `position`
+        to `group`, or None. `holds(group, position)` tells whether a literal
+        is currently assigned.
+        """
+        literal = (group, position)
+        watching = self._watches.get(literal)
+        if not watching:
+            return None
+
+        kept = []
+        culprits = None
+
+        for i, nogood in enumerate(watching):
+            moved = False
+            for other in nogood:
+                if other != literal and not holds(*other):
+                    self._watches.setdefault(other, []).append(nogood)
+                    moved = True
+                    break
+
+            if not moved:
+                culprits = [other for other, _ in nogood if other is not group]
+                kept.append(nogood)
+                kept.extend(watching[i + 1:])
+                break
+
+        self._watches[literal] = kept
+        return culprits
@@ -0,0 +1,238 @@
+# src/scheduling/parallel_search.py
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import List, Optional
+
+from .schedule_state import ScheduleState
+from .group import Group
+from .scheduler import Scheduler
+from .presolve import presolve
+from .shared_problem import SharedProblem, attach
+
+
+def _solve(handle, prefix, options, node_limit, time_limit, stop):
+    """
+    Worker entry point: fix the prefix, search the rest of the tree with a
+    node budget and return plain results. The instance comes from shared
+    memory and is built once per process; it is left unassigned afterwards.
+    """
+    state, groups = attach(handle)
+    by_id = {g.group_id: g for g in groups}
+
+    try:
+        for group_id, (classroom_name, day, block) in prefix:
+            if not state.assign(by_id[group_id], classroom_name, day, block):
+                return False, "infeasible", {}
+
+        solver = Scheduler(**options)
+        rest = [g for g in groups if not g.is_assigned()]
+
+        success = solver.schedule(
+            state, rest, time_limit=time_limit, node_limit=node_limit, should_stop=stop.is_set
+        )
+
+        assignments = {g.group_id: g.assignment for g in groups if g.assignment is not None}
+        return success, solver.status, assignments
+
+    finally:
+        for group in groups:
+            state.unassign(group)
+
+
+class ParallelScheduler:
+    """
+    Exhaustive search split across worker processes.
+
+    The tree is cut into subtrees, each given by a prefix of fixed
+    assignments. The root split branches on the group with the fewest free
+    slots (one slot per class of identical rooms), and keeps splitting until
+    there are `tasks_per_worker` subtrees per worker. Each subtree is solved
+    by a `Scheduler` with `split_nodes` nodes; one that runs out is split
+    again on its own most constrained group and its children go back to the
+    queue, so workers that finish early pick up the hard parts of the tree.
+
+    The first complete schedule stops every worker. The instance is
+    infeasible when every subtree is.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        split_nodes: int = 5000,
+        tasks_per_worker: int = 4,
+        **options
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.split_nodes = split_nodes
+        self.tasks_per_worker = tasks_per_worker
+
+        # Opciones del Scheduler de cada subárbol
+        self.options = options
+
+        self.status = None
+        self.presolve_report = None
+        self.tasks = 0
+        self.splits = 0
+
+    def schedule(
+        self,
+        state: ScheduleState,
+        groups: List[Group],
+        time_limit: Optional[float] = None
+    ) -> bool:
+
+        self.presolve_report = presolve(state, groups)
+        if not self.presolve_report.feasible:
+            self.status = "infeasible"
+            return False
+
+        deadline = None if time_limit is None else time.monotonic() + time_limit
+        pending = [g for g in groups if not g.is_assigned()]
+
+        self.tasks = 0
+        self.splits = 0
+
+        queue = self._expand(state, pending, self.workers * self.tasks_per_worker)
+
+        # Los trabajadores leen la instancia de memoria compartida: cada tarea
+        # sólo lleva su prefijo
+        with SharedProblem(state, pending) as shared, multiprocessing.Manager() as manager:
+            stop = manager.Event()
+
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                result = self._run(pool, shared.handle, state, pending, queue, deadline, stop)
+                stop.set()
+
+        return self._replay(state, pending, result)
+
+    def _expand(self, state, groups, size: int) -> list:
+
+        # Reparto inicial: se abre el árbol a lo ancho hasta tener trabajo para todos
+        queue = [()]
+        while queue and len(queue) < size:
+            children = self._split(state, groups, queue[0])
+            if children is None:
+                break
+            queue = queue[1:] + children
+
+        return queue
+
+    def _replay(self, state, groups, result) -> bool:
+
+        if result is None:
+            return False
+
+        by_id = {g.group_id: g for g in groups}
+        for group_id, (classroom_name, day, block) in result.items():
+            group = by_id[group_id]
+            if not group.is_assigned():
+                state.assign(group, classroom_name, day, block)
+
+        self.status = "solved"
+        return True
+
+    def _run(self, pool, handle, state, groups, queue, deadline, stop):
+
+        # Pila de subárboles: los hijos se exploran antes que los hermanos, y
+        # sólo hay una tarea en vuelo por trabajador
+        stack = list(reversed(queue))
+        running = {}
+
+        while stack or running:
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+
+            while stack and len(running) < self.workers:
+                time_limit = None
+                if deadline is not None:
+                    time_limit = max(deadline - time.monotonic(), 0)
+
+                prefix = stack.pop()
+                future = pool.submit(
+                    _solve, handle, prefix, self.options, self.split_nodes, time_limit, stop
+                )
+                running[future] = prefix
+                self.tasks += 1
+
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                prefix = running.pop(future)
+                success, status, assignments = future.result()
+
+                if success:
+                    return assignments
+
+                # Subárbol que agotó sus nodos: se divide y vuelve a la pila
+                if status == "budget":
+                    self.splits += 1
+                    stack.extend(reversed(self._split(state, groups, prefix)))
+
+        self.status = "budget" if stack or running else "infeasible"
+
+        return None
+
+    def _split(self, state, groups, prefix):
+        """
+        Children of a subtree: the prefix extended with each free slot of the
+        unfixed group with the fewest of them. None when every group is fixed,
+        which never happens for a subtree that ran out of nodes.
+        """
+        by_id = {g.group_id: g for g in groups}
+        fixed = []
+
+        for group_id, (classroom_name, day, block) in prefix:
+            group = by_id[group_id]
+            if not state.assign(group, classroom_name, day, block):
+                break
+            fixed.append(group)
+
+        try:
+            if len(fixed) < len(prefix):
+                return []
+
+            best = None
+            best_slots = None
+
+            for group in groups:
+                if group.is_assigned():
+                    continue
+
+                slots = self._slots(state, group)
+                if best is None or len(slots) < len(best_slots):
+                    best, best_slots = group, slots
+
+            if best is None:
+                return None
+
+            return [prefix + ((best.group_id, slot),) for slot in best_slots]
+
+        finally:
+            for group in fixed:
+                state.unassign(group)
+
+    @staticmethod
+    def _slots(state, group) -> list:
+
+        # Aulas idénticas (tipo, capacidad y ocupación) dan subárboles iguales
+        classes = state.room_classes()
+        seen = set()
+        slots = []
+
+        for name, classroom in state.classrooms.items():
+            if classroom.room_type != group.required_room_type or classroom.capacity < group.size:
+                continue
+            if classes[name] in seen:
+                continue
+            seen.add(classes[name])
+
+            for day in range(1, state.time_model.days_count + 1):
+                for block in range(1, state.time_model.blocks_per_day - group.duration + 2):
+                    if classroom.is_available(day, block, group.duration):
+                        slots.append((name, day, block))
+
+        return slots
@@ -0,0 +1,196 @@
+# src/scheduling/partial.py
+
+import random
+import time
+from typing import List, Optional
+
+from .schedule_state import ScheduleState
+from .group import Group
+from .greedy import GreedyScheduler
+
+
+class PartialScheduler(GreedyScheduler):
+    """
+    Anytime maximum-placement search for instances that cannot be (or were
+    not) solved in full.
+
+    Starts from the first-fit placement. Each step takes an unplaced group
+    and puts it in the slot that displaces the fewest placed groups; the
+    displaced ones go back to the unplaced list and are tried in free slots
+    right away. A group that was just placed cannot be displaced again for
+    `tabu_tenure` steps, and with probability `walk_probability` any
+    non-fixed slot is taken. The best placement seen is restored in the
+    state at the end; the groups it leaves out are listed in `unplaced`.
+    """
+
+    def __init__(
+        self,
+        max_steps: int = 5000,
+        tabu_tenure: int = 10,
+        walk_probability: float = 0.05,
+        seed: Optional[int] = None
+    ):
+        super().__init__()
+        self.max_steps = max_steps
+        self.tabu_tenure = tabu_tenure
+        self.walk_probability = walk_probability
+        self.seed = seed
+
+        self.unplaced = []
+        self.steps = 0
+
+    def schedule(
+        self,
+        state: ScheduleState,
+        groups: List[Group],
+        time_limit: Optional[float] = None
+    ) -> bool:
+
+        deadline = None if time_limit is None else time.monotonic() + time_limit
+        rng = random.Random(self.seed)
+
+        pending = [g for g in groups if not g.is_assigned()]
+        placed, unplaced = self._first_fit(state, pending)
+
+        # Celda -> grupo colocado aquí (los ya asignados antes quedan fijos)
+        self._owner = {}
+        for group in placed:
+            self._mark(group, group)
+
+        best = {g: g.assignment for g in placed}
+        tabu = {}
+        self.steps = 0
+
+        while unplaced and self.steps < self.max_steps:
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+
+            self.steps += 1
+
+            group = unplaced.pop(rng.randrange(len(unplaced)))
+            walk = rng.random() < self.walk_probability
+            slot, blockers = self._choose_slot(state, group, tabu, walk, rng)
+
+            if slot is None:
+                unplaced.append(group)
+                continue
+
+            for blocker in blockers:
+                self._unassign(state, blocker)
+            self._assign(state, group, *slot)
+            tabu[group] = self.steps + self.tabu_tenure
+
+            for blocker in blockers:
+                if not self._first_free(state, blocker):
+                    unplaced.append(blocker)
+
+            if len(pending) - len(unplaced) > len(best):
+                best = {g: g.assignment for g in pending if g.assignment is not None}
+
+        # Se deja en el estado la mejor colocación vista
+        for group in pending:
+            if group.is_assigned() and best.get(group) != group.assignment:
+                self._unassign(state, group)
+        for group, assignment in best.items():
+            if not group.is_assigned():
+                self._assign(state, group, *assignment)
+
+        self.unplaced = [g for g in pending if not g.is_assigned()]
+        self.placed = len(pending) - len(self.unplaced)
+        self.status = "solved" if not self.unplaced else "partial"
+
+        return not self.unplaced
+
+    def _rooms(self, state, group) -> list:
+        return sorted(
+            (c for c in state.classrooms.values()
+             if c.room_type == group.required_room_type and c.capacity >= group.size),
+            key=lambda c: (c.capacity, c.name)
+        )
+
+    def _choose_slot(self, state, group, tabu: dict, walk: bool, rng):
+
+        days = state.time_model.days_count
+        blocks = state.time_model.blocks_per_day
+
+        options = []
+        fewest = None
+
+        for classroom in self._rooms(state, group):
+            for day in range(1, days + 1):
+                for block in range(1, blocks - group.duration + 2):
+
+                    blockers = self._blockers(classroom, day, block, group.duration)
+                    if blockers is None:
+                        continue
+
+                    slot = (classroom.name, day, block)
+
+                    if not blockers:
+                        return slot, blockers
+
+                    if walk:
+                        options.append((slot, blockers))
+                        continue
+
+                    if any(tabu.get(b, 0) > self.steps for b in blockers):
+                        continue
+
+                    if fewest is None or len(blockers) < fewest:
+                        options, fewest = [], len(blockers)
+                    if len(blockers) == fewest:
+                        options.append((slot, blockers))
+
+        # Fuera de los pasos aleatorios sólo se desplaza a un grupo por vez
+        if not options or (not walk and fewest > 1):
+            return None, None
+
+        return rng.choice(options)
+
+    def _blockers(self, classroom, day: int, block: int, duration: int):
+        """
+        Groups placed here that occupy the given run, or None if part of it
+        is taken by fixed occupancy or by groups assigned before this run.
+        """
+        blockers = {}
+
+        for b in range(block, block + duration):
+            if not classroom.is_occupied(day, b):
+                continue
+
+            owner = self._owner.get((classroom.name, day, b))
+            if owner is None:
+                return None
+            blockers[owner] = None
+
+        return list(blockers)
+
+    def _first_free(self, state, group) -> bool:
+
+        days = state.time_model.days_count
+        blocks = state.time_model.blocks_per_day
+
+        for classroom in self._rooms(state, group):
+            for day in range(1, days + 1):
+                for block in range(1, blocks - group.duration + 2):
+                    if classroom.is_available(day, block, group.duration):
+                        self._assign(state, group, classroom.name, day, block)
+                        return True
+
+        return False
+
+    def _assign(self, state, group, classroom_name: str, day: int, block: int):
+        state.assign(group, classroom_name, day, block)
+        self._mark(group, group)
+
+    def _unassign(self, state, group):
+        self._mark(group, None)
+        state.unassign(group)
+
+    def _mark(self, group, owner):
+        classroom_name, day, block = group.assignment
+        for b in range(block, block + group.duration):
+            if owner is None:
+                del self._owner[(classroom_name, day, b)]
+            else:
+                self._owner[(classroom_name, day, b)] = owner
@@ -0,0 +1,134 @@
+# src/scheduling/portfolio.py
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import List, Optional
+
+from .schedule_state import ScheduleState
+from .group import Group
+from .scheduler import Scheduler
+from .greedy import GreedyScheduler
+from .local_search import LocalSearchScheduler
+from .presolve import presolve
+
+
+# Configuraciones por defecto: (tipo de solver, opciones del constructor)
+DEFAULT_PORTFOLIO = [
+    ("greedy", {}),
+    ("backtrack", {}),
+    ("backtrack", {"variable_heuristic": "domwdeg", "restarts": "luby", "seed": 1}),
+    ("backtrack", {"restarts": "geometric", "seed": 2}),
+    ("local", {"seed": 3}),
+    ("backtrack", {"variable_heuristic": "domwdeg", "restarts": "luby", "seed": 4}),
+    ("local", {"seed": 5}),
+    ("backtrack", {"restarts": "luby", "seed": 6}),
+]
+
+SOLVERS = {
+    "backtrack": Scheduler,
+    "greedy": GreedyScheduler,
+    "local": LocalSearchScheduler,
+}
+
+
+def _solve(state, groups, kind, options, time_limit, stop):
+    """Worker entry point: run one configuration and return plain results."""
+    solver = SOLVERS[kind](**options)
+
+    success = solver.schedule(state, groups, time_limit=time_limit, should_stop=stop.is_set)
+    status = solver.status
+
+    assignments = {g.group_id: g.assignment for g in groups if g.assignment is not None}
+    return success, status, assignments
+
+
+class PortfolioScheduler:
+    """
+    Runs several differently configured solvers in parallel processes and
+    keeps the first complete schedule, or the first proof of infeasibility
+    from a complete solver. The others are told to stop through a shared
+    event. The winning assignments are replayed into the caller's state.
+
+    One process per configuration: only the first `workers` entries of
+    `configs` are run, by default as many as there are CPU cores.
+    """
+
+    def __init__(self, configs: Optional[list] = None, workers: Optional[int] = None):
+        self.configs = configs or DEFAULT_PORTFOLIO
+        self.workers = workers or min(len(self.configs), os.cpu_count() or 1)
+
+        self.status = None
+        self.presolve_report = None
+        self.winner = None
+
+    def schedule(
+        self,
+        state: ScheduleState,
+        groups: List[Group],
+        time_limit: Optional[float] = None
+    ) -> bool:
+
+        # El chequeo de conteo es barato: no vale la pena lanzar procesos
+        self.presolve_report = presolve(state, groups)
+        if not self.presolve_report.feasible:
+            self.status = "infeasible"
+            return False
+
+        deadline = None if time_limit is None else time.monotonic() + time_limit
+        configs = self.configs[:self.workers]
+
+        with multiprocessing.Manager() as manager:
+            stop = manager.Event()
+
+            with ProcessPoolExecutor(max_workers=len(configs)) as pool:
+                futures = {
+                    pool.submit(_solve, state, groups, kind, options, time_limit, stop): (kind, options)
+                    for kind, options in configs
+                }
+
+                result = self._first_conclusive(futures, deadline)
+                stop.set()
+
+                for future in futures:
+                    future.cancel()
+
+        if result is None:
+            self.status = "budget"
+            return False
+
+        success, status, assignments, self.winner = result
+        self.status = status
+
+        if not success:
+            return False
+
+        by_id = {g.group_id: g for g in groups}
+        for group_id, (classroom_name, day, block) in assignments.items():
+            group = by_id[group_id]
+            if not group.is_assigned():
+                state.assign(group, classroom_name, day, block)
+
+        return True
+
+    @staticmethod
+    def _first_conclusive(futures: dict, deadline):
+
+        pending = set(futures)
+
+        while pending:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            if not done:
+                return None
+
+            for future in done:
+                success, status, assignments = future.result()
+
+                # Sólo un solver completo puede probar que no hay solución
+                if success or status == "infeasible":
+                    return success, status, assignments, futures[future]
+
+        return None
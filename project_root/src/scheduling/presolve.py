@@ -0,0 +1,115 @@
+# src/scheduling/presolve.py
+
+from typing import List
+
+from .schedule_state import ScheduleState
+from .group import Group
+
+
+class PresolveReport:
+    """
+    Result of the counting checks run before search. Each shortfall is a
+    dict with the room type, the size/duration thresholds of the groups
+    involved, the kind of check ("hours" or "slots") and the demand and
+    capacity that were compared.
+    """
+
+    def __init__(self, shortfalls: list):
+        self.shortfalls = shortfalls
+
+    @property
+    def feasible(self) -> bool:
+        return not self.shortfalls
+
+    def by_room_type(self) -> dict:
+        result = {}
+        for shortfall in self.shortfalls:
+            result.setdefault(shortfall["room_type"], []).append(shortfall)
+        return result
+
+    def __str__(self) -> str:
+        lines = []
+        for s in self.shortfalls:
+            unit = "bloques-hora" if s["kind"] == "hours" else "franjas"
+            lines.append(
+                f"{s['room_type']} (grupos de ≥{s['min_size']} alumnos y ≥{s['min_duration']} bloques): "
+                f"se necesitan {s['demand']} {unit}, hay {s['capacity']} "
+                f"(faltan {s['demand'] - s['capacity']})"
+            )
+        return "\n".join(lines)
+
+
+def _free_runs(state: ScheduleState, classroom) -> list:
+    # Longitudes de los tramos libres contiguos de cada día
+    runs = []
+    blocks = state.time_model.blocks_per_day
+
+    for day in range(1, state.time_model.days_count + 1):
+        mask = classroom.occupancy.get(day, 0)
+        length = 0
+        for block in range(1, blocks + 1):
+            if mask >> block & 1:
+                if length:
+                    runs.append(length)
+                length = 0
+            else:
+                length += 1
+        if length:
+            runs.append(length)
+
+    return runs
+
+
+def presolve(state: ScheduleState, groups: List[Group]) -> PresolveReport:
+    """
+    Necessary conditions for placing every unassigned group, per room type.
+
+    For each size threshold s and duration threshold d, the groups with
+    size >= s and duration >= d can only use free runs of at least d blocks
+    in rooms with capacity >= s. Their total duration must fit in those runs
+    and their count must not exceed the sum of floor(run / d). Violations
+    prove the input infeasible without searching.
+    """
+    runs_by_room = {}
+    rooms_by_type = {}
+    for classroom in state.classrooms.values():
+        rooms_by_type.setdefault(classroom.room_type, []).append(classroom)
+        runs_by_room[classroom.name] = _free_runs(state, classroom)
+
+    groups_by_type = {}
+    for group in groups:
+        if not group.is_assigned():
+            groups_by_type.setdefault(group.required_room_type, []).append(group)
+
+    shortfalls = []
+
+    for room_type, typed in groups_by_type.items():
+        rooms = rooms_by_type.get(room_type, [])
+
+        for min_size in sorted({g.size for g in typed}):
+            runs = [
+                run for classroom in rooms if classroom.capacity >= min_size
+                for run in runs_by_room[classroom.name]
+            ]
+            sized = [g for g in typed if g.size >= min_size]
+
+            for min_duration in sorted({g.duration for g in sized}):
+                needing = [g for g in sized if g.duration >= min_duration]
+
+                checks = (
+                    ("hours", sum(g.duration for g in needing), sum(r for r in runs if r >= min_duration)),
+                    ("slots", len(needing), sum(r // min_duration for r in runs)),
+                )
+
+                for kind, demand, capacity in checks:
+                    if demand > capacity:
+                        shortfalls.append({
+                            "room_type": room_type,
+                            "min_size": min_size,
+                            "min_duration": min_duration,
+                            "kind": kind,
+                            "demand": demand,
+                            "capacity": capacity,
+                        })
+
+    return PresolveReport(shortfalls)
@@ -1,6 +1,9 @@
 # src/scheduling/schedule_state.py
 
 from typing import List
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
 from .time_model import TimeModel
 from .classroom import Classroom
 from .group import Group
@@ -8,11 +11,68 @@ from .group import Group
 
 class ScheduleState:
 
-    def __init__(self, time_model: TimeModel, classrooms: List[Classroom]):
+    def __init__(self, time_model: TimeModel, classrooms: List[Classroom], vectorized: bool = False):
         self.time_model = time_model
         self.classrooms = {c.name: c for c in classrooms}
         self.assignments = {}
 
+        # Modo vectorizado: tensor aulas x días x bloques (True = ocupado)
+        self.room_names = list(self.classrooms)
+        self.room_index = {name: i for i, name in enumerate(self.room_names)}
+        self.grid = None
+
+        if vectorized:
+            self.refresh_grid()
+
+    @property
+    def vectorized(self) -> bool:
+        return self.grid is not None
+
+    def refresh_grid(self) -> None:
+        """Rebuild the occupancy tensor from the classrooms' own bitmasks."""
+        days = self.time_model.days_count
+        blocks = self.time_model.blocks_per_day
+        bits = np.arange(1, blocks + 1, dtype=np.int64)
+
+        self.grid = np.zeros((len(self.room_names), days, blocks), dtype=bool)
+
+        for i, name in enumerate(self.room_names):
+            for day, mask in self.classrooms[name].occupancy.items():
+                if 1 <= day <= days:
+                    self.grid[i, day - 1] = (mask >> bits) & 1
+
+    def room_classes(self) -> dict:
+        """
+        Map each classroom name to an equivalence class id. Rooms share a class
+        when they have the same type, capacity and occupancy pattern.
+        """
+        classes = {}
+        result = {}
+
+        for name, classroom in self.classrooms.items():
+            key = (
+                classroom.room_type,
+                classroom.capacity,
+                tuple(sorted(classroom.occupancy.items()))
+            )
+            result[name] = classes.setdefault(key, len(classes))
+
+        return result
+
+    def feasible_starts(self, duration: int, room_ids) -> np.ndarray:
+        """
+        Boolean array (rooms, days, starts) telling whether each room can host
+        `duration` consecutive blocks from each start. Index 0 is block 1.
+        """
+        room_ids = np.asarray(room_ids, dtype=np.intp)
+        starts = self.time_model.blocks_per_day - duration + 1
+
+        if starts <= 0 or duration <= 0 or len(room_ids) == 0:
+            return np.zeros((len(room_ids), self.time_model.days_count, max(starts, 0)), dtype=bool)
+
+        windows = sliding_window_view(self.grid[room_ids], duration, axis=2)
+        return ~windows.any(axis=-1)
+
     def assign(self, group: Group, classroom_name: str, day: int, start_block: int) -> bool:
 
         if classroom_name not in self.classrooms:
@@ -33,6 +93,7 @@ class ScheduleState:
             return False
 
         classroom.occupy(day, start_block, group.duration)
+        self._mark(classroom_name, day, start_block, group.duration, True)
 
         group.assignment = (classroom_name, day, start_block)
         self.assignments[group.group_id] = group.assignment
@@ -48,6 +109,14 @@ class ScheduleState:
         classroom = self.classrooms[classroom_name]
 
         classroom.release(day, start_block, group.duration)
+        self._mark(classroom_name, day, start_block, group.duration, False)
 
         group.assignment = None
-        del self.assignments[group.group_id]
\ No newline at end of file
+        del self.assignments[group.group_id]
+
+    def _mark(self, classroom_name: str, day: int, start_block: int, duration: int, value: bool) -> None:
+        if self.grid is None:
+            return
+
+        room = self.room_index[classroom_name]
+        self.grid[room, day - 1, start_block - 1:start_block - 1 + duration] = value
@@ -1,128 +1,842 @@
 # src/scheduling/scheduler.py
 
-from typing import List
+import random
+import time
+from typing import Callable, List, Optional
+import numpy as np
+
 from .schedule_state import ScheduleState
 from .group import Group
+from .conflict_index import ConflictIndex
+from .sparse_domain import SparseDomain
+from .variable_queue import VariableQueue
+from .nogood_store import NogoodStore
+from .presolve import presolve
+
+
+def _luby(i: int) -> int:
+    # Secuencia de Luby: 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, ...
+    k = 1
+    while (1 << k) - 1 < i:
+        k += 1
+
+    while i != (1 << k) - 1:
+        i -= (1 << (k - 1)) - 1
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+
+    return 1 << (k - 1)
+
+
+class _Frame:
+
+    __slots__ = ("group", "values", "next", "mark", "depth", "conflict", "skipped")
+
+    def __init__(self, group, values, depth):
+        self.group = group
+        self.values = values
+        self.next = 0
+        self.mark = 0
+        self.depth = depth
+
+        # Grupos anteriores que explican los fallos de este nivel (CBJ)
+        self.conflict = {}
+        self.skipped = False
 
 
 class Scheduler:
 
-    def schedule(self, state: ScheduleState, groups: List[Group]) -> bool:
-        self._all_groups = groups
-        self._initialize_domains(state, groups)
+    def __init__(
+        self,
+        lcv_cutoff: int = 400,
+        symmetry_breaking: bool = True,
+        room_symmetry: bool = True,
+        backjumping: bool = True,
+        restarts: Optional[str] = None,
+        restart_base: int = 100,
+        restart_growth: float = 1.5,
+        seed: Optional[int] = None,
+        variable_heuristic: str = "mrv",
+        presolve: bool = True,
+        cumulative: bool = True
+    ):
+        # Por encima de este tamaño de dominio no se ordena por LCV
+        self.lcv_cutoff = lcv_cutoff
+        self.symmetry_breaking = symmetry_breaking
+        self.room_symmetry = room_symmetry
+        self.backjumping = backjumping
+
+        # Reinicios: None, "luby" o "geometric"; límite de nodos por corrida
+        if restarts not in (None, "luby", "geometric"):
+            raise ValueError(f"Unknown restart strategy: {restarts}")
+        self.restarts = restarts
+        self.restart_base = restart_base
+        self.restart_growth = restart_growth
+        self.seed = seed
+
+        # "mrv": dominio más pequeño; "domwdeg": dominio / peso de fallos
+        if variable_heuristic not in ("mrv", "domwdeg"):
+            raise ValueError(f"Unknown variable heuristic: {variable_heuristic}")
+        self.variable_heuristic = variable_heuristic
+
+        # Chequeo de conteo antes de buscar; el informe queda en presolve_report
+        self.presolve = presolve
+        self.presolve_report = None
+
+        # Propagación acumulativa por (tipo de aula, día, bloque)
+        self.cumulative = cumulative
+        self._rng = None
+
+        # "solved", "infeasible" o "budget" tras cada llamada a schedule()
+        self.status = None
+
+    def schedule(
+        self,
+        state: ScheduleState,
+        groups: List[Group],
+        time_limit: Optional[float] = None,
+        node_limit: Optional[int] = None,
+        should_stop: Optional[Callable[[], bool]] = None
+    ) -> bool:
+        """
+        Assign every group, returning True on success. When False, `status`
+        tells a proven infeasibility ("infeasible") from a search cut short
+        by `time_limit` seconds, `node_limit` nodes or `should_stop()`
+        returning True ("budget"). `should_stop` is polled every 256 nodes.
+        """
+        self._deadline = None if time_limit is None else time.monotonic() + time_limit
+        self._node_limit = node_limit
+        self._should_stop = should_stop
+        self.nodes = 0
+
+        if self.presolve:
+            self.presolve_report = presolve(state, groups)
+            if not self.presolve_report.feasible:
+                self.status = "infeasible"
+                return False
+
+        # Pila de dominios podados, para deshacer en O(1) por valor
+        self._trail = []
+
+        if state.vectorized:
+            state.refresh_grid()
+            self._initialize_domains_vectorized(state, groups)
+        else:
+            self._initialize_domains(state, groups)
+
+        self._conflicts = ConflictIndex.from_groups(groups)
+        self._room_class = self._detect_room_classes(state)
+        self._siblings = self._sibling_chains(groups) if self.symmetry_breaking else {}
+        self._positions = {}
+
+        # Quién podó cada dominio (grupo -> {grupo asignado: valores podados})
+        self._pruners = {g: {} for g in groups}
+        self._nogoods = NogoodStore()
+
+        # Pesos dom/wdeg: crecen con cada vaciado de dominio y se conservan entre reinicios
+        self._weights = {g: 1 for g in groups} if self.variable_heuristic == "domwdeg" else None
+
+        # Partes obligatorias: bloques que todo valor vivo del grupo ocupa
+        self._parts = {}
+        self._holders = {}
+        self._rooms_by_type = {}
+        for classroom in state.classrooms.values():
+            self._rooms_by_type.setdefault(classroom.room_type, []).append(classroom)
+
+        # Podas en la raíz: sólo dependen de la entrada y nunca se deshacen
+        if self.cumulative and not self._propagate_cumulative(state, groups):
+            self.status = "infeasible"
+            return False
 
         # Orden inicial por MRV (menos opciones primero)
         groups.sort(key=lambda g: len(g.domain))
+        self._degree = self._degrees(state, groups)
+
+        # Los nogoods aprendidos siguen valiendo entre corridas
+        rng = random.Random(self.seed)
+        self.runs = 0
 
-        return self._backtrack(state, groups)
+        while True:
+            self.runs += 1
+
+            # La primera corrida es determinista; las siguientes desempatan al azar
+            self._rng = rng if self.runs > 1 else None
+            result = self._search(state, groups, self._run_limit(self.runs))
+
+            if result is not None:
+                self.status = "solved" if result else "infeasible"
+                return result
+
+            if self._exhausted(self._node_limit):
+                self.status = "budget"
+                return False
+
+    def _run_limit(self, run: int) -> Optional[int]:
+
+        if self.restarts == "luby":
+            cutoff = self.nodes + self.restart_base * _luby(run)
+        elif self.restarts == "geometric":
+            cutoff = self.nodes + int(self.restart_base * self.restart_growth ** (run - 1))
+        else:
+            cutoff = None
+
+        if self._node_limit is None:
+            return cutoff
+        if cutoff is None:
+            return self._node_limit
+        return min(cutoff, self._node_limit)
+
+    def _exhausted(self, limit: Optional[int]) -> bool:
+        if limit is not None and self.nodes >= limit:
+            return True
+        if self._should_stop is not None and self.nodes % 256 == 0 and self._should_stop():
+            return True
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    @staticmethod
+    def _signature(group: Group) -> tuple:
+        return (group.required_room_type, group.duration, group.size, group.suggested_classroom)
 
     def _initialize_domains(self, state: ScheduleState, groups: List[Group]):
 
+        # Un dominio base por firma, compartido (copy-on-write) entre grupos idénticos
+        base_domains = {}
+
         for group in groups:
-            domain = []
+            signature = self._signature(group)
 
-            for classroom in state.classrooms.values():
+            if signature not in base_domains:
+                base_domains[signature] = self._base_domain(state, group)
 
-                if classroom.room_type != group.required_room_type:
-                    continue
+            group.domain = SparseDomain(base_domains[signature])
 
-                if classroom.capacity < group.size:
-                    continue
+    def _base_domain(self, state: ScheduleState, group: Group) -> list:
 
-                max_start = state.time_model.blocks_per_day - group.duration + 1
+        domain = []
 
-                for day in range(1, state.time_model.days_count + 1):
-                    for block in range(1, max_start + 1):
+        for classroom in state.classrooms.values():
 
-                        if classroom.is_available(day, block, group.duration):
-                            domain.append((classroom, day, block))
+            if classroom.room_type != group.required_room_type:
+                continue
 
-            group.domain = domain
+            if classroom.capacity < group.size:
+                continue
 
-    def _backtrack(self, state: ScheduleState, groups: List[Group]) -> bool:
+            max_start = state.time_model.blocks_per_day - group.duration + 1
 
-        unassigned = [g for g in groups if not g.is_assigned()]
+            for day in range(1, state.time_model.days_count + 1):
+                for block in range(1, max_start + 1):
 
-        if not unassigned:
-            return True
+                    if classroom.is_available(day, block, group.duration):
+                        domain.append((classroom, day, block))
 
-        # MRV dinámico
-        group = min(unassigned, key=lambda g: len(g.domain))
+        return domain
 
-        # LCV ligero: ordenar por menor impacto estimado
-        ordered_domain = sorted(
-            group.domain,
-            key=lambda assignment: self._estimate_impact(state, group, assignment, unassigned),
-            reverse=True
-        )
+    def _initialize_domains_vectorized(self, state: ScheduleState, groups: List[Group]):
+
+        classrooms = [state.classrooms[name] for name in state.room_names]
+        base_domains = {}
+
+        for group in groups:
+            signature = self._signature(group)
+
+            if signature not in base_domains:
+                room_ids = np.array([
+                    i for i, classroom in enumerate(classrooms)
+                    if classroom.room_type == group.required_room_type
+                    and classroom.capacity >= group.size
+                ], dtype=np.intp)
+
+                # Una sola pasada de ventana deslizante para todo el dominio
+                rooms, days, blocks = np.nonzero(state.feasible_starts(group.duration, room_ids))
 
-        for classroom, day, block in ordered_domain:
+                rows = np.column_stack((room_ids[rooms], days + 1, blocks + 1))
 
-            if state.assign(group, classroom.name, day, block):
+                base_domains[signature] = [(classrooms[r], d, b) for r, d, b in rows.tolist()]
 
-                removed = self._forward_check(state, group, unassigned)
+            group.domain = SparseDomain(base_domains[signature])
 
-                self._all_groups = groups
-                if removed is not None and self._backtrack(state, groups):
+    def _search(self, state: ScheduleState, groups: List[Group], limit: Optional[int] = None):
+        """
+        One depth-first run. Returns True or False when it is conclusive and
+        None when `limit` nodes or the deadline were reached first; the state
+        is left untouched in that case.
+        """
+        # Cola de prioridad MRV con desempate por grado, actualizada de forma perezosa
+        order = None
+        if self._rng is not None:
+            order = {group: self._rng.random() for group in groups}
+
+        self._queue = VariableQueue(self._degree, order, self._weights)
+        self._depth = {}
+        for group in groups:
+            if not group.is_assigned():
+                self._queue.push(group)
+
+        if not self._queue:
+            return True
+
+        stack = [self._open(0)]
+
+        while stack:
+            frame = stack[-1]
+
+            if self._exhausted(limit):
+                self._unwind(state, stack)
+                return None
+
+            # Volvemos de un hijo fallido: deshacer el intento anterior
+            if frame.group.is_assigned():
+                self._retract(state, frame)
+
+            if self._advance(state, frame):
+                if not self._queue:
                     return True
+                stack.append(self._open(len(stack)))
+                continue
+
+            conflict = self._close(stack)
+
+            if not self.backjumping:
+                continue
+
+            # Ningún grupo anterior explica el fallo: no hay solución
+            if not conflict:
+                self._unwind(state, stack)
+                return False
+
+            # Salto directo al culpable más profundo
+            target = max(self._depth[g] for g in conflict)
+
+            # Un conflicto que abarca todo el camino no se repetirá: no se aprende
+            if len(conflict) < len(stack):
+                culprit = stack[target].group
+                self._nogoods.learn(
+                    ((g, self._positions[g]) for g in conflict),
+                    watch=(culprit, self._positions[culprit])
+                )
+
+            while stack[-1].depth > target:
+                self._retract(state, stack[-1])
+                self._close(stack)
+
+            culprit = stack[-1]
+            for g in conflict:
+                if g is not culprit.group:
+                    culprit.conflict[g] = None
+
+        return False
+
+    def _unwind(self, state, stack):
+        while stack:
+            if stack[-1].group.is_assigned():
+                self._retract(state, stack[-1])
+            self._close(stack)
+
+    def _retract(self, state, frame: _Frame):
+        self._undo(frame.mark)
+        state.unassign(frame.group)
+
+    def _close(self, stack) -> dict:
+
+        frame = stack.pop()
+        group = frame.group
+
+        self._reinstate(group)
+        self._queue.push(group)
+        del self._depth[group]
+
+        # Si se descartaron aulas simétricas, el fallo depende de todo el camino
+        if frame.skipped:
+            return {f.group: None for f in stack}
+
+        return frame.conflict
+
+    def _sibling_chains(self, groups: List[Group]) -> dict:
+
+        # Grupos del mismo curso con el mismo dominio base son intercambiables
+        chains = {}
+        for group in groups:
+            if group.course_code is None:
+                continue
+            key = (group.course_code, id(group.domain.values))
+            chains.setdefault(key, []).append(group)
+
+        # Orden de los valores para la restricción: por (día, bloque, clase de aula).
+        # Aulas equivalentes empatan, así el orden sigue siendo válido cuando
+        # además se rompe la simetría entre aulas.
+        self._rank_orders = {}
+        room_class = self._room_class
+        for chain in chains.values():
+            values = chain[0].domain.values
+            if len(chain) <= 1 or id(values) in self._rank_orders:
+                continue
+
+            def key(p):
+                return (values[p][1], values[p][2], room_class[values[p][0].name])
+
+            order = sorted(range(len(values)), key=lambda p: (key(p), p))
+            rank = [0] * len(values)
+            ties = [None] * len(values)
+
+            first = 0
+            for r in range(1, len(order) + 1):
+                if r == len(order) or key(order[r]) != key(order[first]):
+                    for k in range(first, r):
+                        rank[order[k]] = k
+                        ties[order[k]] = (first, r)
+                    first = r
+
+            self._rank_orders[id(values)] = (order, rank, ties)
+
+        return {
+            group: (chain, i)
+            for chain in chains.values() if len(chain) > 1
+            for i, group in enumerate(chain)
+        }
+
+    def _detect_room_classes(self, state: ScheduleState) -> dict:
+
+        if self.room_symmetry:
+            classes = state.room_classes()
+            sizes = {}
+            for class_id in classes.values():
+                sizes[class_id] = sizes.get(class_id, 0) + 1
+            self._shared_classes = {c for c, size in sizes.items() if size > 1}
+            return classes
+
+        # Sin detección, cada aula es su propia clase
+        return {name: i for i, name in enumerate(state.classrooms)}
+
+    def _degrees(self, state: ScheduleState, groups: List[Group]) -> dict:
+
+        # Grado: cuántos otros grupos compiten por al menos una misma aula
+        rooms_by_need = {}
+        for group in groups:
+            need = (group.required_room_type, group.size)
+            if need not in rooms_by_need:
+                rooms_by_need[need] = frozenset(
+                    c.name for c in state.classrooms.values()
+                    if c.room_type == group.required_room_type and c.capacity >= group.size
+                )
+
+        count_by_need = {}
+        for group in groups:
+            need = (group.required_room_type, group.size)
+            count_by_need[need] = count_by_need.get(need, 0) + 1
+
+        degree_by_need = {
+            need: sum(
+                count for other, count in count_by_need.items()
+                if rooms & rooms_by_need[other]
+            )
+            for need, rooms in rooms_by_need.items()
+        }
+
+        return {
+            group: max(degree_by_need[(group.required_room_type, group.size)] - 1, 0)
+            for group in groups
+        }
+
+    def _open(self, depth: int) -> _Frame:
+
+        group = self._queue.pop()
+        self._depth[group] = depth
+
+        self._withdraw(group)
+
+        positions = self._ordered_values(group)
+        frame = _Frame(group, self._class_representatives(group, positions), depth)
+        frame.mark = len(self._trail)
+        frame.skipped = len(frame.values) < len(positions)
+
+        # Los valores ya podados también explican el fallo del grupo
+        frame.conflict = dict.fromkeys(self._pruners[group])
+
+        return frame
+
+    def _class_representatives(self, group, positions: list) -> list:
+
+        if not self.room_symmetry or not self._shared_classes:
+            return positions
+
+        # Aulas de la misma clase con idéntica ocupación actual son intercambiables:
+        # se ramifica sobre (clase, día, bloque) y el aula concreta es la primera vista.
+        values = group.domain.values
+        room_class = self._room_class
+        signatures = {}
+        seen = set()
+        kept = []
 
-                self._restore_domains(removed)
+        for position in positions:
+            classroom, day, block = values[position]
+
+            if room_class[classroom.name] not in self._shared_classes:
+                kept.append(position)
+                continue
+
+            signature = signatures.get(classroom.name)
+            if signature is None:
+                signature = (room_class[classroom.name], tuple(sorted(classroom.occupancy.items())))
+                signatures[classroom.name] = signature
+
+            key = (signature, day, block)
+            if key not in seen:
+                seen.add(key)
+                kept.append(position)
+
+        return kept
+
+    def _advance(self, state, frame: _Frame) -> bool:
+
+        group = frame.group
+
+        while frame.next < len(frame.values):
+            position = frame.values[frame.next]
+            frame.next += 1
+
+            classroom, day, block = group.domain.values[position]
+            if not state.assign(group, classroom.name, day, block):
+                continue
+
+            self.nodes += 1
+            frame.mark = len(self._trail)
+            self._positions[group] = position
+
+            culprits = self._nogoods.violated(group, position, self._holds)
+            if culprits is not None:
+                frame.conflict.update(dict.fromkeys(culprits))
                 state.unassign(group)
+                continue
+
+            if self._forward_check(state, group) and self._break_symmetry(group, position) \
+                    and self._propagate_assignment(state, group, frame.mark):
+                for other in dict.fromkeys(entry[0] for entry in self._trail[frame.mark:]):
+                    if other is not None:
+                        self._queue.update(other)
+                return True
+
+            # Fallo: los que lo explican entran en el conjunto de conflicto
+            for culprit in self._culprits:
+                if culprit is not group:
+                    frame.conflict[culprit] = None
+
+            if self._weights is not None:
+                self._weigh_failure(group)
+
+            self._undo(frame.mark)
+            state.unassign(group)
 
         return False
 
-    def _forward_check(self, state, assigned_group, unassigned):
+    def _weigh_failure(self, group):
+
+        # El grupo vaciado y todos los que explican el fallo comparten la culpa
+        wiped = self._wiped
+        weights = self._weights
+
+        for culprit in self._culprits:
+            weights[culprit] += 1
+        if group not in self._culprits:
+            weights[group] += 1
+
+        if wiped is not None:
+            weights[wiped] += 1
+            self._queue.update(wiped)
+
+    def _holds(self, group, position: int) -> bool:
+        return group.is_assigned() and self._positions[group] == position
+
+    def _ordered_values(self, group):
 
-        removed = {}
+        positions = group.domain.positions()
+        rng = self._rng
 
-        for other in unassigned:
+        if len(positions) > self.lcv_cutoff:
+            if rng is not None:
+                positions = list(positions)
+                rng.shuffle(positions)
+            return positions
 
-            if other == assigned_group:
+        # LCV: primero los valores que eliminan menos opciones a los demás
+        conflicts = self._conflicts
+        values = group.domain.values
+
+        if rng is None:
+            return sorted(
+                positions,
+                key=lambda position: conflicts.pressure(values[position], group.duration)
+            )
+
+        return sorted(
+            positions,
+            key=lambda position: (conflicts.pressure(values[position], group.duration), rng.random())
+        )
+
+    def _withdraw(self, group):
+        # El grupo deja de competir: sus valores ya no cuentan como carga
+        for value in group.domain:
+            self._conflicts.adjust(value, group.duration, -1)
+
+    def _reinstate(self, group):
+        for value in group.domain:
+            self._conflicts.adjust(value, group.duration, 1)
+
+    def _forward_check(self, state, assigned_group) -> bool:
+
+        classroom_name, day, start_block = assigned_group.assignment
+        conflicts = self._conflicts
+
+        # Solo los valores que cubren las celdas recién ocupadas pueden caer
+        for other, position in conflicts.overlapping(
+            classroom_name, day, start_block, assigned_group.duration
+        ):
+            if other is assigned_group or other.is_assigned():
                 continue
 
-            to_remove = []
+            if not self._prune(other, position, assigned_group):
+                return False
+
+        return True
+
+    def _break_symmetry(self, assigned_group, position: int) -> bool:
+
+        if assigned_group not in self._siblings:
+            return True
+
+        # Orden lexicográfico entre hermanos: G1 <= G2 <= ... según (día, bloque, clase).
+        # Basta con podar al hermano libre contiguo de cada lado; la cadena se
+        # cierra cuando ése, a su vez, se asigna.
+        chain, i = self._siblings[assigned_group]
+        order, rank, ties = self._rank_orders[id(assigned_group.domain.values)]
+        first, stop = ties[position]
+
+        if i + 1 < len(chain) and not chain[i + 1].is_assigned():
+            if not self._prune_ranks(chain[i + 1], order, rank, 0, first, assigned_group):
+                return False
 
-            for assignment in other.domain:
-                classroom, day, block = assignment
+        if i > 0 and not chain[i - 1].is_assigned():
+            if not self._prune_ranks(chain[i - 1], order, rank, stop, len(order), assigned_group):
+                return False
 
-                if not state.classrooms[classroom.name].is_available(
-                    day, block, other.duration
-                ):
-                    to_remove.append(assignment)
+        return True
 
-            if to_remove:
-                removed[other.group_id] = to_remove
-                for assignment in to_remove:
-                    other.domain.remove(assignment)
+    def _prune_ranks(self, group, order, rank, start: int, stop: int, reason) -> bool:
 
-                if not other.domain:
-                    self._restore_domains(removed)
-                    return None
+        if len(group.domain) < stop - start:
+            doomed = [p for p in group.domain.positions() if start <= rank[p] < stop]
+        else:
+            doomed = order[start:stop]
 
-        return removed
+        for position in doomed:
+            if not self._prune(group, position, reason):
+                return False
+
+        return True
+
+    def _prune(self, group, position: int, reason) -> bool:
+        """
+        Remove one value (if still live) because of `reason`'s assignment,
+        or of every group in `reason` when it is a tuple. Returns False when
+        the domain is wiped out.
+        """
+        if not group.domain.remove(position):
+            return True
 
-    def _restore_domains(self, removed):
+        self._conflicts.adjust(group.domain.values[position], group.duration, -1)
+        self._trail.append((group, reason))
 
-        if not removed:
+        pruners = self._pruners[group]
+        if type(reason) is tuple:
+            for culprit in reason:
+                pruners[culprit] = pruners.get(culprit, 0) + 1
+        else:
+            pruners[reason] = pruners.get(reason, 0) + 1
+
+        if not group.domain:
+            self._wiped = group
+            self._culprits = pruners
+            return False
+
+        return True
+
+    def _propagate_assignment(self, state, group, mark: int) -> bool:
+
+        if not self.cumulative:
+            return True
+
+        # El grupo asignado ya ocupa su aula: deja de contar como parte obligatoria
+        self._set_part(group, None)
+
+        classroom_name, day, start_block = group.assignment
+        room_type = group.required_room_type
+        pending = {}
+
+        for block in range(start_block, start_block + group.duration):
+            if not self._check_cell(room_type, day, block, pending):
+                return False
+
+        for entry in self._trail[mark:]:
+            if entry[0] is not None:
+                pending[entry[0]] = None
+
+        return self._propagate_cumulative(state, pending)
+
+    def _propagate_cumulative(self, state, groups) -> bool:
+        """
+        Recompute the compulsory part of each given group and check every
+        (room type, day, block) it newly covers. Groups pruned on the way are
+        processed too, until nothing changes.
+        """
+        pending = dict.fromkeys(groups)
+
+        while pending:
+            group = next(iter(pending))
+            del pending[group]
+
+            if group.is_assigned():
+                continue
+
+            old = self._parts.get(group)
+            part = self._compulsory(group)
+            if part == old:
+                continue
+
+            self._set_part(group, part)
+            if part is None:
+                continue
+
+            day, low, high = part
+            for block in range(low, high + 1):
+                if old is not None and old[0] == day and old[1] <= block <= old[2]:
+                    continue
+                if not self._check_cell(group.required_room_type, day, block, pending):
+                    return False
+
+        return True
+
+    @staticmethod
+    def _compulsory(group):
+
+        # Intersección de todas las corridas vivas, si caen el mismo día
+        day = None
+        for _, value_day, start in group.domain:
+            if day is None:
+                day, low, high = value_day, start, start + group.duration - 1
+            elif value_day != day:
+                return None
+            else:
+                low = max(low, start)
+                high = min(high, start + group.duration - 1)
+
+            if low > high:
+                return None
+
+        return None if day is None else (day, low, high)
+
+    def _set_part(self, group, part, record: bool = True):
+
+        old = self._parts.get(group)
+        if old == part:
             return
 
-        for group_id, assignments in removed.items():
-            for group in self._all_groups:
-                if group.group_id == group_id:
-                    group.domain.extend(assignments)
+        room_type = group.required_room_type
+        holders = self._holders
 
-    def _estimate_impact(self, state, group, assignment, unassigned):
+        if old is not None:
+            day, low, high = old
+            for block in range(low, high + 1):
+                del holders[(room_type, day, block)][group]
 
-        classroom, day, block = assignment
+        if part is not None:
+            day, low, high = part
+            for block in range(low, high + 1):
+                holders.setdefault((room_type, day, block), {})[group] = None
+            self._parts[group] = part
+        else:
+            self._parts.pop(group, None)
 
-        state.assign(group, classroom.name, day, block)
+        # Entrada sin grupo en el trail: se restaura al deshacer
+        if record:
+            self._trail.append((None, (group, old)))
 
-        impact = 0
-        for other in unassigned:
-            if other == group:
+    def _check_cell(self, room_type, day: int, block: int, pending: dict) -> bool:
+
+        holders = self._holders.get((room_type, day, block))
+        if not holders:
+            return True
+
+        free = [
+            classroom for classroom in self._rooms_by_type.get(room_type, ())
+            if not classroom.is_occupied(day, block)
+        ]
+        if len(holders) < len(free):
+            return True
+
+        reasons = self._cell_reasons(room_type, day, block, holders)
+
+        # Más grupos forzados a este bloque que aulas libres del tipo
+        if len(holders) > len(free):
+            self._wiped = None
+            self._culprits = reasons
+            return False
+
+        # Justo tantos como aulas: nadie más puede usar el bloque
+        for classroom in free:
+            for other, position in self._conflicts.covering(classroom.name, day, block):
+                if other in holders or other.is_assigned():
+                    continue
+
+                size = len(other.domain)
+                if not self._prune(other, position, reasons):
+                    return False
+                if len(other.domain) < size:
+                    pending[other] = None
+
+        return True
+
+    def _cell_reasons(self, room_type, day: int, block: int, holders) -> tuple:
+
+        # Podadores de las partes obligatorias y grupos que ocupan aulas del tipo
+        reasons = {}
+        for holder in holders:
+            reasons.update(dict.fromkeys(self._pruners[holder]))
+
+        for classroom in self._rooms_by_type[room_type]:
+            if not classroom.is_occupied(day, block):
+                continue
+            for other, position in self._conflicts.covering(classroom.name, day, block):
+                if other.is_assigned() and self._positions.get(other) == position:
+                    reasons[other] = None
+                    break
+
+        return tuple(reasons)
+
+    def _undo(self, mark: int):
+
+        trail = self._trail
+        conflicts = self._conflicts
+
+        touched = {}
+
+        while len(trail) > mark:
+            group, reason = trail.pop()
+
+            if group is None:
+                self._set_part(*reason, record=False)
                 continue
-            impact += len(other.domain)
 
-        state.unassign(group)
+            position = group.domain.undo_remove()
+            conflicts.adjust(group.domain.values[position], group.duration, 1)
+            touched[group] = None
+
+            pruners = self._pruners[group]
+            for culprit in (reason if type(reason) is tuple else (reason,)):
+                if pruners[culprit] == 1:
+                    del pruners[culprit]
+                else:
+                    pruners[culprit] -= 1
 
-        return impact
\ No newline at end of file
+        for group in touched:
+            self._queue.update(group)
@@ -0,0 +1,140 @@
+# src/scheduling/shared_problem.py
+
+import pickle
+from multiprocessing import shared_memory
+from typing import List
+
+import numpy as np
+
+from .schedule_state import ScheduleState
+from .classroom import Classroom
+from .group import Group
+from .compiled import CompiledProblem
+
+
+# Instancia ya adjuntada en este proceso: (nombre del bloque de metadatos, bloques, estado, grupos)
+_attached = None
+
+
+class SharedProblem:
+    """
+    A compiled instance (see `CompiledProblem`) published in shared memory.
+
+    The occupancy grid and the room and group arrays live in
+    `multiprocessing.shared_memory` blocks, next to one block with the few
+    Python values the arrays cannot hold (names, time model, course codes).
+    `handle` only names the blocks, so it is cheap to send with every task;
+    workers call `attach(handle)` to map them read-only. The owner must call
+    `close` (or use it as a context manager) to free the blocks.
+    """
+
+    def __init__(self, state: ScheduleState, groups: List[Group]):
+        problem = CompiledProblem(state, groups)
+
+        arrays = {
+            "busy": problem.busy,
+            "room_type": problem.room_type,
+            "capacity": problem.capacity,
+            "group_type": problem.group_type,
+            "duration": problem.duration,
+            "size": problem.size,
+        }
+
+        meta = pickle.dumps({
+            "time_model": state.time_model,
+            "vectorized": state.vectorized,
+            "room_names": problem.room_names,
+            "type_names": list(problem.type_ids),
+            "groups": [(g.group_id, g.suggested_classroom, g.course_code) for g in groups],
+        })
+
+        self._blocks = []
+        self.handle = {"meta": (self._publish(np.frombuffer(meta, dtype=np.uint8)), len(meta))}
+
+        for name, array in arrays.items():
+            self.handle[name] = (self._publish(array), array.shape, array.dtype.str)
+
+    def _publish(self, array: np.ndarray) -> str:
+
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+
+        self._blocks.append(block)
+        return block.name
+
+    def close(self):
+
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def attach(handle: dict):
+    """
+    Map a published instance and rebuild the worker's private state and
+    groups from it. The result is cached: later calls in the same process
+    with the same handle return the same objects, which the caller must
+    leave unassigned between tasks.
+    """
+    global _attached
+
+    meta_name, meta_size = handle["meta"]
+    if _attached is not None and _attached[0] == meta_name:
+        return _attached[2], _attached[3]
+
+    if _attached is not None:
+        for block in _attached[1]:
+            block.close()
+
+    blocks = []
+
+    def view(name, shape, dtype):
+        block = shared_memory.SharedMemory(name=name)
+        blocks.append(block)
+
+        array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        array.flags.writeable = False
+        return array
+
+    meta = pickle.loads(bytes(view(meta_name, (meta_size,), "u1")))
+    arrays = {key: view(*value) for key, value in handle.items() if key != "meta"}
+
+    time_model = meta["time_model"]
+    type_names = meta["type_names"]
+
+    # Sólo la ocupación de las aulas es propia de cada proceso: cambia al asignar
+    bits = 1 << np.arange(1, time_model.blocks_per_day + 1, dtype=np.int64)
+    classrooms = []
+
+    for i, name in enumerate(meta["room_names"]):
+        classroom = Classroom(
+            name, int(arrays["capacity"][i]), type_names[arrays["room_type"][i]], time_model
+        )
+
+        masks = arrays["busy"][i].astype(np.int64) @ bits
+        classroom.occupancy = {day + 1: int(mask) for day, mask in enumerate(masks) if mask}
+        classrooms.append(classroom)
+
+    groups = [
+        Group(
+            group_id,
+            int(arrays["duration"][i]),
+            type_names[arrays["group_type"][i]],
+            size=int(arrays["size"][i]),
+            suggested_classroom=suggested,
+            course_code=course_code
+        )
+        for i, (group_id, suggested, course_code) in enumerate(meta["groups"])
+    ]
+
+    state = ScheduleState(time_model, classrooms, vectorized=meta["vectorized"])
+
+    _attached = (meta_name, blocks, state, groups)
+    return state, groups
@@ -0,0 +1,64 @@
+# src/scheduling/sparse_domain.py
+
+from array import array
+
+
+class SparseDomain:
+    """
+    Domain stored as a sparse set over a fixed list of values.
+
+    Values keep a stable position in `values`; the live ones are the first
+    `size` entries of `_dense`. Removing swaps the value just past the live
+    prefix, so undoing removals in reverse order only needs `size += 1`.
+
+    `values` is not copied: groups with the same signature share one base
+    list. The index arrays are only created on the first removal and are
+    stored as C ints (4 bytes per entry each), so a pruned domain costs
+    8 bytes per base value instead of a list of boxed positions.
+    """
+
+    def __init__(self, values: list):
+        self.values = values
+        self._dense = None
+        self._sparse = None
+        self.size = len(values)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        if self._dense is None:
+            return iter(self.values)
+
+        values = self.values
+        dense = self._dense
+        return (values[dense[i]] for i in range(self.size))
+
+    def positions(self) -> list:
+        if self._dense is None:
+            return list(range(self.size))
+        return self._dense[:self.size].tolist()
+
+    def remove(self, position: int) -> bool:
+        if self._dense is None:
+            self._dense = array("i", range(len(self.values)))
+            self._sparse = array("i", self._dense)
+
+        i = self._sparse[position]
+        if i >= self.size:
+            return False
+
+        last = self.size - 1
+        moved = self._dense[last]
+
+        self._dense[i] = moved
+        self._sparse[moved] = i
+        self._dense[last] = position
+        self._sparse[position] = last
+
+        self.size = last
+        return True
+
+    def undo_remove(self) -> int:
+        self.size += 1
+        return self._dense[self.size - 1]
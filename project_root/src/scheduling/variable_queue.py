@@ -0,0 +1,71 @@
+# src/scheduling/variable_queue.py
+
+import heapq
+
+
+class VariableQueue:
+    """
+    Priority queue of unassigned groups keyed by current domain size (MRV),
+    or by domain size divided by failure weight when `weight` is given
+    (dom/wdeg). Ties are broken by higher degree and then by insertion
+    order, or by the `order` keys when given (used to randomize ties
+    between restarts).
+
+    Updates are lazy: every push gets a fresh stamp and older entries for the
+    same group are skipped when they surface. Picking a group costs O(log n).
+    """
+
+    def __init__(self, degree: dict = None, order: dict = None, weight: dict = None):
+        self._degree = degree or {}
+        self._weight = weight
+        self._heap = []
+        self._stamp = {}
+        self._order = dict(order) if order else {}
+        self._counter = 0
+
+    def __len__(self) -> int:
+        return len(self._stamp)
+
+    def push(self, group) -> None:
+        if group not in self._order:
+            self._order[group] = len(self._order)
+
+        self._counter += 1
+        self._stamp[group] = self._counter
+
+        size = len(group.domain)
+        if self._weight is not None:
+            size /= self._weight[group]
+
+        heapq.heappush(self._heap, (
+            size,
+            -self._degree.get(group, 0),
+            self._order[group],
+            self._counter,
+            group
+        ))
+
+        if len(self._heap) > 4 * len(self._stamp) + 64:
+            self._compact()
+
+    def update(self, group) -> None:
+        if group in self._stamp:
+            self.push(group)
+
+    def pop(self):
+        heap = self._heap
+        stamp = self._stamp
+
+        while heap:
+            entry = heapq.heappop(heap)
+            group = entry[-1]
+
+            if stamp.get(group) == entry[3]:
+                del stamp[group]
+                return group
+
+        raise IndexError("pop from an empty VariableQueue")
+
+    def _compact(self) -> None:
+        self._heap = [entry for entry in self._heap if self._stamp.get(entry[-1]) == entry[3]]
+        heapq.heapify(self._heap)
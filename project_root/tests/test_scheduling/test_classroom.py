@@ -21,4 +21,21 @@ def test_classroom_occupy_and_release():
 
     classroom.release(day_i, block_i, 2)
 
-    assert classroom.is_available(day_i, block_i, 2)
\ No newline at end of file
+    assert classroom.is_available(day_i, block_i, 2)
+
+def test_classroom_occupancy_masks_only_overlapping_runs():
+    classroom = Classroom("A1", capacity=30, room_type="REGULAR")
+
+    classroom.occupy(1, 3, 2)
+
+    assert classroom.is_occupied(1, 3)
+    assert classroom.is_occupied(1, 4)
+    assert not classroom.is_occupied(1, 5)
+    assert classroom.is_available(1, 1, 2)
+    assert classroom.is_available(1, 5, 3)
+    assert not classroom.is_available(1, 2, 2)
+    assert classroom.is_available(2, 3, 2)
+
+    classroom.release(1, 3, 2)
+
+    assert classroom.occupancy == {}
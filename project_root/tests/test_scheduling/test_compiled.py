@@ -0,0 +1,39 @@
+from src.scheduling.compiled import CompiledProblem
+from src.scheduling.schedule_state import ScheduleState
+from src.scheduling.time_model import TimeModel
+from src.scheduling.classroom import Classroom
+from src.scheduling.group import Group
+
+
+def test_compiled_problem_lists_free_starts_as_integer_cells():
+    tm = TimeModel(["Lunes", "Martes"], [7, 8, 9])
+
+    rooms = [
+        Classroom("A1", 30, "REGULAR", tm),
+        Classroom("A2", 60, "REGULAR", tm),
+        Classroom("L1", 30, "LAB", tm),
+    ]
+    rooms[1].occupy(2, 2, 1)
+
+    groups = [
+        Group("G1", 2, "REGULAR", size=50),
+        Group("G2", 1, "LAB"),
+        Group("G3", 2, "REGULAR", size=50),
+    ]
+
+    for vectorized in (False, True):
+        problem = CompiledProblem(ScheduleState(tm, rooms, vectorized=vectorized), groups)
+
+        assert problem.type_ids == {"REGULAR": 0, "LAB": 1}
+        assert problem.rooms(0).tolist() == [1]
+
+        # G1 sólo cabe en A2, y el martes el bloque 2 está ocupado
+        assert [problem.slot(c) for c in problem.starts(0)] == [("A2", 1, 1), ("A2", 1, 2)]
+        assert problem.starts(2) is problem.starts(0)
+
+        assert len(problem.starts(1)) == 6
+        assert problem.to_assignments({1: problem.starts(1)[-1]}) == {"G2": ("L1", 2, 3)}
+
+    for cell in range(3 * 2 * 3):
+        room, day, block = problem.slot(cell)
+        assert problem.room_names.index(room) * 6 + (day - 1) * 3 + block - 1 == cell
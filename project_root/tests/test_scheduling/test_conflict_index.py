@@ -0,0 +1,41 @@
+from src.scheduling.classroom import Classroom
+from src.scheduling.group import Group
+from src.scheduling.conflict_index import ConflictIndex
+from src.scheduling.sparse_domain import SparseDomain
+
+
+def test_conflict_index_returns_only_overlapping_values():
+    a1 = Classroom("A1", 30, "REGULAR")
+    a2 = Classroom("A2", 30, "REGULAR")
+
+    group = Group("G1", duration=2, required_room_type="REGULAR")
+    group.domain = SparseDomain([(a1, 1, 1), (a1, 1, 3), (a2, 1, 1)])
+
+    index = ConflictIndex.from_groups([group])
+
+    hits = [position for _, position in index.overlapping("A1", 1, 2, 1)]
+
+    assert hits == [0]
+    assert [position for _, position in index.overlapping("A1", 1, 2, 2)] == [0, 1]
+    assert list(index.overlapping("A1", 2, 1, 3)) == []
+
+
+
+def test_conflict_index_shares_entries_between_identical_groups():
+    a1 = Classroom("A1", 30, "REGULAR")
+    base = [(a1, 1, 1), (a1, 1, 2)]
+
+    first = Group("C-G1", duration=1, required_room_type="REGULAR")
+    second = Group("C-G2", duration=1, required_room_type="REGULAR")
+    first.domain = SparseDomain(base)
+    second.domain = SparseDomain(base)
+
+    index = ConflictIndex.from_groups([first, second])
+
+    assert list(index.overlapping("A1", 1, 1, 1)) == [(first, 0), (second, 0)]
+    assert index.load[("A1", 1, 2)] == 2
+
+    first.domain.remove(0)
+
+    assert len(first.domain) == 1
+    assert len(second.domain) == 2
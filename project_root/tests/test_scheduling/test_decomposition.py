@@ -0,0 +1,76 @@
+from src.scheduling.decomposition import DecomposedScheduler, components
+from src.scheduling.schedule_state import ScheduleState
+from src.scheduling.time_model import TimeModel
+from src.scheduling.classroom import Classroom
+from src.scheduling.group import Group
+from src.scheduling.course import Course
+
+
+def _rooms(tm):
+    return [
+        Classroom("A1", 30, "REGULAR", tm),
+        Classroom("A2", 60, "REGULAR", tm),
+        Classroom("L1", 20, "LAB", tm),
+        Classroom("L2", 20, "LAB", tm),
+        Classroom("S1", 30, "SALA", tm),
+    ]
+
+
+def test_components_follow_room_type_and_capacity():
+    tm = TimeModel(["Lunes"], [7, 8, 9])
+    state = ScheduleState(tm, _rooms(tm))
+
+    groups = [
+        Group("R1", 1, "REGULAR", size=50),
+        Group("R2", 1, "REGULAR", size=10),
+        Group("L1", 1, "LAB"),
+        Group("X1", 1, "AUDITORIO"),
+    ]
+
+    parts = {tuple(g.group_id for g in members): sorted(names) for names, members in components(state, groups)}
+
+    # R2 cabe en A1 y A2, así que une a los dos grupos regulares; S1 no se usa
+    assert parts == {
+        ("R1", "R2"): ["A1", "A2"],
+        ("L1",): ["L1", "L2"],
+        ("X1",): [],
+    }
+
+
+def test_decomposed_scheduler_merges_component_results():
+    tm = TimeModel(["Lunes", "Martes"], [7, 8, 9])
+
+    for workers in (1, 2):
+        state = ScheduleState(tm, _rooms(tm), vectorized=True)
+
+        groups = Course("MAT101", 3, 2, "REGULAR").generate_groups()
+        groups += Course("QUI101", 4, 3, "LAB").generate_groups()
+
+        scheduler = DecomposedScheduler(workers=workers)
+
+        assert scheduler.schedule(state, groups, time_limit=30)
+        assert scheduler.status == "solved"
+        assert len(scheduler.components) == 2
+        assert len(state.assignments) == len(groups)
+        assert all(g.is_assigned() for g in groups)
+
+
+
+def test_decomposed_scheduler_failure_leaves_state_untouched():
+    tm = TimeModel(["Lunes"], [7, 8, 9, 10])
+
+    for workers in (1, 2):
+        state = ScheduleState(tm, _rooms(tm))
+
+        # Los regulares tienen solución; los laboratorios pasan el chequeo de
+        # conteo pero tras dos grupos de 3 bloques no queda lugar para el de 2
+        groups = Course("MAT101", 2, 2, "REGULAR").generate_groups()
+        groups += [Group("L1", 3, "LAB"), Group("L2", 3, "LAB"), Group("L3", 2, "LAB")]
+
+        scheduler = DecomposedScheduler(workers=workers)
+
+        assert not scheduler.schedule(state, groups, time_limit=30)
+        assert scheduler.presolve_report.feasible
+        assert scheduler.status == "infeasible"
+        assert state.assignments == {}
+        assert not any(g.is_assigned() for g in groups)
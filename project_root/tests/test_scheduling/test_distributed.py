@@ -0,0 +1,80 @@
+import multiprocessing
+
+from src.scheduling.distributed import Coordinator, work
+from src.scheduling.scheduler import Scheduler
+from src.scheduling.schedule_state import ScheduleState
+from src.scheduling.time_model import TimeModel
+from src.scheduling.classroom import Classroom
+from src.scheduling.group import Group
+
+
+AUTHKEY = b"sorth-test"
+
+# Sin propagación ni simetrías, para que el árbol tenga miles de nodos
+OPTIONS = {"cumulative": False, "backjumping": False, "symmetry_breaking": False}
+
+
+def _instance(last_duration):
+    tm = TimeModel(["Lunes"], [7, 8, 9, 10])
+    state = ScheduleState(tm, [Classroom(f"A{i}", 30 + i, "REGULAR", tm) for i in range(5)])
+
+    # Con el último grupo de 2 bloques no hay solución: cada aula queda con
+    # un solo bloque libre tras su grupo de 3
+    groups = [Group(f"G{i}", 3, "REGULAR") for i in range(5)]
+    groups.append(Group("H", last_duration, "REGULAR"))
+
+    return state, groups
+
+
+def _start_workers(coordinator, count):
+    workers = [
+        multiprocessing.Process(target=work, args=(coordinator.address, AUTHKEY))
+        for _ in range(count)
+    ]
+    for worker in workers:
+        worker.start()
+    return workers
+
+
+def test_coordinator_steals_work_to_prove_infeasibility():
+    state, groups = _instance(2)
+    assert not Scheduler(**OPTIONS).schedule(state, groups)
+
+    state, groups = _instance(2)
+
+    # Una sola tarea inicial y sin límite de nodos: el segundo trabajador
+    # sólo recibe trabajo robándoselo al primero
+    coordinator = Coordinator(authkey=AUTHKEY, split_nodes=None, tasks_per_worker=1, **OPTIONS)
+    workers = _start_workers(coordinator, 2)
+
+    assert not coordinator.schedule(state, groups, time_limit=60)
+    assert coordinator.status == "infeasible"
+    assert coordinator.connected == 2
+    assert coordinator.steals > 0
+    assert state.assignments == {}
+
+    for worker in workers:
+        worker.join(10)
+        assert worker.exitcode == 0
+
+
+def test_coordinator_replays_the_schedule_found_by_a_worker():
+    state, groups = _instance(1)
+
+    coordinator = Coordinator(authkey=AUTHKEY, split_nodes=50, **OPTIONS)
+    workers = _start_workers(coordinator, 3)
+
+    assert coordinator.schedule(state, groups, time_limit=60)
+    assert coordinator.status == "solved"
+    assert len(state.assignments) == len(groups)
+
+    used = set()
+    for group in groups:
+        room, day, block = group.assignment
+        for b in range(block, block + group.duration):
+            assert (room, day, b) not in used
+            used.add((room, day, b))
+
+    for worker in workers:
+        worker.join(10)
+        assert worker.exitcode == 0
@@ -0,0 +1,42 @@
+from src.scheduling.greedy import GreedyScheduler
+from src.scheduling.schedule_state import ScheduleState
+from src.scheduling.time_model import TimeModel
+from src.scheduling.classroom import Classroom
+from src.scheduling.group import Group
+from src.scheduling.course import Course
+
+
+def test_greedy_places_common_case_without_search():
+    tm = TimeModel(["Lunes", "Martes"], list(range(7, 13)))
+
+    rooms = [Classroom("A1", 30, "REGULAR", tm), Classroom("L1", 20, "LAB", tm)]
+    state = ScheduleState(tm, rooms)
+
+    groups = Course("MAT101", 3, 2, "REGULAR").generate_groups()
+    groups += Course("FIS101", 2, 3, "LAB").generate_groups()
+
+    scheduler = GreedyScheduler()
+
+    assert scheduler.schedule(state, groups)
+    assert scheduler.status == "solved"
+    assert scheduler.placed == len(groups)
+    assert state.assignments["FIS101-G1"] == ("L1", 1, 1)
+
+
+def test_greedy_falls_back_to_backtracking_when_first_fit_fails():
+    tm = TimeModel(["Lunes", "Martes"], list(range(7, 13)))
+
+    room = Classroom("A1", 30, "REGULAR", tm)
+    room.occupy(2, 5, 1)
+    state = ScheduleState(tm, [room])
+
+    # Primer ajuste pone el de 4 bloques el lunes y deja fuera uno de 3;
+    # la solución es 3 + 3 el lunes y 4 + 1 el martes.
+    groups = [Group(f"G{i}", d, "REGULAR") for i, d in enumerate([1, 3, 4, 3])]
+
+    scheduler = GreedyScheduler()
+
+    assert scheduler.schedule(state, groups)
+    assert scheduler.placed < len(groups)
+    assert len(state.assignments) == len(groups)
+    assert state.assignments["G2"][1] == 2
@@ -0,0 +1,66 @@
+from src.scheduling.incremental import IncrementalScheduler
+from src.scheduling.schedule_state import ScheduleState
+from src.scheduling.time_model import TimeModel
+from src.scheduling.classroom import Classroom
+from src.scheduling.group import Group
+from src.scheduling.course import Course
+from src.scheduling.greedy import GreedyScheduler
+
+
+def _instance(tm, codes):
+    state = ScheduleState(tm, [Classroom(f"A{i}", 30, "REGULAR", tm) for i in range(3)], vectorized=True)
+
+    groups = []
+    for code in codes:
+        groups += Course(code, 3, 2, "REGULAR").generate_groups()
+
+    return state, groups
+
+
+def test_blocked_slot_only_moves_the_group_that_used_it():
+    tm = TimeModel(["Lunes", "Martes"], list(range(7, 13)))
+
+    state, groups = _instance(tm, ("MAT101", "FIS101", "QUI101"))
+    assert GreedyScheduler().schedule(state, groups)
+    previous = dict(state.assignments)
+
+    # Se va QUI101, llega BIO101 y se bloquea una hora de MAT101-G1
+    state, groups = _instance(tm, ("MAT101", "FIS101", "BIO101"))
+    room, day, block = previous["MAT101-G1"]
+
+    scheduler = IncrementalScheduler()
+
+    assert scheduler.schedule(state, groups, previous, blocked=[(room, day, block + 1)])
+    assert scheduler.status == "solved"
+    assert scheduler.ring == 0
+    assert scheduler.added == ["BIO101-G1", "BIO101-G2", "BIO101-G3"]
+    assert scheduler.removed == ["QUI101-G1", "QUI101-G2", "QUI101-G3"]
+    assert scheduler.displaced == ["MAT101-G1"] + scheduler.added
+    assert scheduler.moved == ["MAT101-G1"]
+
+    assert len(state.assignments) == len(groups)
+    assert state.classrooms[room].is_occupied(day, block + 1)
+
+
+def test_repair_releases_only_groups_competing_for_the_same_rooms():
+    tm = TimeModel(["Lunes"], [7, 8, 9, 10, 11])
+    state = ScheduleState(tm, [Classroom("A1", 30, "REGULAR", tm), Classroom("L1", 30, "LAB", tm)])
+
+    groups = [
+        Group("A", 2, "REGULAR"),
+        Group("B", 1, "REGULAR"),
+        Group("L", 1, "LAB"),
+        Group("C", 2, "REGULAR"),
+    ]
+    previous = {"A": ("A1", 1, 2), "B": ("A1", 1, 5), "L": ("L1", 1, 3), "GONE": ("A1", 1, 1)}
+
+    # Con A y B fijos sólo quedan los bloques 1 y 4: C (2 bloques) no entra
+    scheduler = IncrementalScheduler()
+
+    assert scheduler.schedule(state, groups, previous)
+    assert scheduler.ring == 1
+    assert scheduler.added == ["C"]
+    assert scheduler.removed == ["GONE"]
+    assert "L" not in scheduler.moved
+    assert state.assignments["L"] == ("L1", 1, 3)
+    assert len(state.assignments) == 4
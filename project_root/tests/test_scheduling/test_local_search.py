@@ -0,0 +1,49 @@
+from src.scheduling.local_search import LocalSearchScheduler
+from src.scheduling.schedule_state import ScheduleState
+from src.scheduling.time_model import TimeModel
+from src.scheduling.classroom import Classroom
+from src.scheduling.group import Group
+
+
+def _tight_state():
+    tm = TimeModel(["Lunes"], [7, 8, 9, 10, 11])
+
+    rooms = [Classroom(f"A{i}", 30, "REGULAR", tm) for i in range(3)]
+    rooms[0].occupy(1, 5, 1)
+
+    return ScheduleState(tm, rooms)
+
+
+def test_local_search_fills_a_tight_instance_without_overlaps():
+    for seed in range(10):
+        state = _tight_state()
+
+        # 14 bloques libres y 14 bloques pedidos
+        groups = [Group(f"L{i}", 3, "REGULAR") for i in range(3)]
+        groups += [Group(f"M{i}", 2, "REGULAR") for i in range(2)]
+        groups += [Group(f"S{i}", 1, "REGULAR") for i in range(1)]
+
+        scheduler = LocalSearchScheduler(seed=seed)
+        assert scheduler.schedule(state, groups, time_limit=10)
+        assert scheduler.status == "solved"
+        assert len(state.assignments) == len(groups)
+
+        used = set()
+        for group in groups:
+            room, day, block = group.assignment
+            cells = {(room, day, b) for b in range(block, block + group.duration)}
+            assert not cells & used
+            used |= cells
+
+
+def test_local_search_leaves_state_untouched_when_out_of_steps():
+    state = _tight_state()
+    groups = [Group(f"L{i}", 3, "REGULAR") for i in range(5)]
+
+    scheduler = LocalSearchScheduler(max_steps=500, seed=0)
+
+    assert not scheduler.schedule(state, groups)
+    assert scheduler.status == "budget"
+    assert scheduler.steps == 500
+    assert state.assignments == {}
+    assert [room.occupancy for room in state.classrooms.values()] == [{1: 1 << 5}, {}, {}]
@@ -0,0 +1,24 @@
+from src.scheduling.group import Group
+from src.scheduling.nogood_store import NogoodStore
+
+
+def test_nogood_store_reports_violation_when_last_literal_is_assigned():
+    g1 = Group("G1", 1, "REGULAR")
+    g2 = Group("G2", 1, "REGULAR")
+    assigned = {}
+
+    def holds(group, position):
+        return assigned.get(group) == position
+
+    store = NogoodStore()
+    assert store.learn([(g1, 0), (g2, 3)], watch=(g2, 3))
+    assert not store.learn([(g2, 3), (g1, 0)], watch=(g1, 0))
+
+    assigned[g2] = 3
+    assert store.violated(g2, 3, holds) is None
+
+    assigned[g1] = 0
+    assert store.violated(g1, 0, holds) == [g2]
+
+    assigned[g1] = 1
+    assert store.violated(g1, 1, holds) is None
@@ -0,0 +1,54 @@
+from src.scheduling.parallel_search import ParallelScheduler
+from src.scheduling.scheduler import Scheduler
+from src.scheduling.schedule_state import ScheduleState
+from src.scheduling.time_model import TimeModel
+from src.scheduling.classroom import Classroom
+from src.scheduling.group import Group
+from src.scheduling.course import Course
+
+
+def test_parallel_search_replays_a_schedule_found_in_a_subtree():
+    tm = TimeModel(["Lunes", "Martes"], list(range(7, 13)))
+    state = ScheduleState(tm, [Classroom(f"A{i}", 30, "REGULAR", tm) for i in range(3)])
+
+    groups = []
+    for code in ("MAT101", "FIS101", "QUI101"):
+        groups += Course(code, 3, 2, "REGULAR").generate_groups()
+
+    scheduler = ParallelScheduler(workers=2)
+
+    assert scheduler.schedule(state, groups, time_limit=30)
+    assert scheduler.status == "solved"
+    # Hay solución en los primeros subárboles: no se reparte más trabajo
+    assert scheduler.tasks <= scheduler.workers
+    assert len(state.assignments) == len(groups)
+
+    used = set()
+    for room, day, block in state.assignments.values():
+        for b in range(block, block + 2):
+            assert (room, day, b) not in used
+            used.add((room, day, b))
+
+
+def test_parallel_search_splits_subtrees_until_infeasibility_is_proven():
+    tm = TimeModel(["Lunes"], [7, 8, 9, 10])
+
+    # Pasa el chequeo de conteo: tres grupos de 3 bloques llenan las tres
+    # aulas y al de 2 sólo le queda un bloque suelto en cada una
+    def instance():
+        state = ScheduleState(tm, [Classroom(f"A{i}", 30 + i, "REGULAR", tm) for i in range(3)])
+        groups = [Group(f"G{i}", 3, "REGULAR") for i in range(3)] + [Group("H", 2, "REGULAR")]
+        return state, groups
+
+    options = {"cumulative": False, "backjumping": False}
+
+    state, groups = instance()
+    assert not Scheduler(**options).schedule(state, groups)
+
+    state, groups = instance()
+    scheduler = ParallelScheduler(workers=2, split_nodes=3, **options)
+
+    assert not scheduler.schedule(state, groups, time_limit=30)
+    assert scheduler.status == "infeasible"
+    assert scheduler.splits > 0
+    assert state.assignments == {}
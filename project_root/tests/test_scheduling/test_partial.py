@@ -0,0 +1,40 @@
+from src.scheduling.partial import PartialScheduler
+from src.scheduling.schedule_state import ScheduleState
+from src.scheduling.time_model import TimeModel
+from src.scheduling.classroom import Classroom
+from src.scheduling.group import Group
+
+
+def test_partial_scheduler_places_more_groups_than_first_fit():
+    tm = TimeModel(["Lunes"], [7, 8, 9, 10, 11])
+
+    room = Classroom("A1", 30, "REGULAR", tm)
+    room.occupy(1, 2, 1)
+    state = ScheduleState(tm, [room])
+
+    # Primer ajuste coloca el grupo de 3 bloques y sólo uno de los cortos;
+    # dejando fuera el largo entran los tres cortos.
+    groups = [Group(f"G{i}", d, "REGULAR") for i, d in enumerate([1, 3, 1, 1])]
+
+    scheduler = PartialScheduler(seed=0)
+
+    assert not scheduler.schedule(state, groups)
+    assert scheduler.status == "partial"
+    assert [g.group_id for g in scheduler.unplaced] == ["G1"]
+    assert sorted(state.assignments) == ["G0", "G2", "G3"]
+
+
+def test_partial_scheduler_keeps_a_valid_schedule_when_overloaded():
+    tm = TimeModel(["Lunes"], list(range(7, 19)))
+
+    state = ScheduleState(tm, [Classroom("L1", 30, "LAB", tm), Classroom("A1", 30, "REGULAR", tm)])
+
+    groups = [Group(f"LAB{i}", 3, "LAB") for i in range(5)]
+    groups += [Group(f"R{i}", 1, "REGULAR") for i in range(8)]
+
+    scheduler = PartialScheduler(seed=0, max_steps=200)
+
+    assert not scheduler.schedule(state, groups, time_limit=10)
+    assert len(scheduler.unplaced) == 1
+    assert len(state.assignments) == 12
+    assert scheduler.placed == 12
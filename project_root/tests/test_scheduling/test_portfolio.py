@@ -0,0 +1,60 @@
+from src.scheduling.portfolio import PortfolioScheduler
+from src.scheduling.schedule_state import ScheduleState
+from src.scheduling.time_model import TimeModel
+from src.scheduling.classroom import Classroom
+from src.scheduling.group import Group
+from src.scheduling.course import Course
+
+
+def test_portfolio_replays_the_winning_schedule_into_the_state():
+    tm = TimeModel(["Lunes", "Martes"], list(range(7, 13)))
+
+    state = ScheduleState(tm, [Classroom(f"A{i}", 30, "REGULAR", tm) for i in range(3)])
+
+    groups = []
+    for code in ("MAT101", "FIS101", "QUI101"):
+        groups += Course(code, 3, 2, "REGULAR").generate_groups()
+
+    scheduler = PortfolioScheduler(workers=3)
+
+    assert scheduler.schedule(state, groups, time_limit=30)
+    assert scheduler.status == "solved"
+    assert len(state.assignments) == len(groups)
+    assert all(g.is_assigned() for g in groups)
+
+    used = set()
+    for room, day, block in state.assignments.values():
+        for b in range(block, block + 2):
+            assert (room, day, b) not in used
+            used.add((room, day, b))
+
+
+def test_portfolio_stops_on_a_proof_of_infeasibility():
+    tm = TimeModel(["Lunes"], list(range(7, 19)))
+
+    lab = Classroom("L1", 30, "LAB", tm)
+    rooms = [Classroom(f"A{i}", 30 + i, "REGULAR", tm) for i in range(3)]
+    for room in rooms:
+        room.occupy(1, 4, 9)
+    state = ScheduleState(tm, [lab] + rooms)
+
+    # El chequeo de conteo ya lo descarta, sin lanzar procesos
+    groups = [Group(f"LAB{i}", 3, "LAB") for i in range(5)]
+    scheduler = PortfolioScheduler(workers=2)
+
+    assert not scheduler.schedule(state, groups)
+    assert scheduler.status == "infeasible"
+
+    # Pasa el conteo pero no tiene solución: tras un grupo de 3 bloques en
+    # cada aula sólo queda un bloque suelto para el de 2
+    tm = TimeModel(["Lunes"], [7, 8, 9, 10])
+    state = ScheduleState(tm, [Classroom(f"A{i}", 30, "REGULAR", tm) for i in range(2)])
+    groups = [Group("G1", 3, "REGULAR"), Group("G2", 3, "REGULAR"), Group("G3", 2, "REGULAR")]
+
+    scheduler = PortfolioScheduler(configs=[("local", {"seed": 0}), ("backtrack", {})], workers=2)
+
+    assert not scheduler.schedule(state, groups, time_limit=30)
+    assert scheduler.status == "infeasible"
+    assert scheduler.presolve_report.feasible
+    assert scheduler.winner[0] == "backtrack"
+    assert state.assignments == {}
@@ -0,0 +1,43 @@
+from src.scheduling.presolve import presolve
+from src.scheduling.schedule_state import ScheduleState
+from src.scheduling.time_model import TimeModel
+from src.scheduling.classroom import Classroom
+from src.scheduling.group import Group
+
+
+def test_presolve_reports_block_hour_shortfall_per_room_type():
+    tm = TimeModel(["Lunes"], [7, 8, 9, 10])
+
+    state = ScheduleState(tm, [
+        Classroom("L1", 30, "LAB", tm),
+        Classroom("A1", 30, "REGULAR", tm),
+    ])
+
+    groups = [Group(f"LAB{i}", 2, "LAB") for i in range(3)]
+    groups += [Group(f"R{i}", 1, "REGULAR") for i in range(4)]
+
+    report = presolve(state, groups)
+
+    assert not report.feasible
+    assert list(report.by_room_type()) == ["LAB"]
+
+    hours = [s for s in report.shortfalls if s["kind"] == "hours"][0]
+    assert (hours["demand"], hours["capacity"]) == (6, 4)
+    assert "faltan 2" in str(report)
+
+
+def test_presolve_counts_runs_that_fit_each_duration():
+    tm = TimeModel(["Lunes"], list(range(7, 14)))
+
+    room = Classroom("A1", 30, "REGULAR", tm)
+    room.occupy(1, 4, 1)
+    state = ScheduleState(tm, [room])
+
+    # Seis bloques libres en dos tramos de tres: sólo caben dos grupos de 2 bloques
+    groups = [Group(f"G{i}", 2, "REGULAR") for i in range(3)]
+    report = presolve(state, groups)
+
+    assert [s["kind"] for s in report.shortfalls] == ["slots"]
+    assert report.shortfalls[0]["capacity"] == 2
+
+    assert presolve(state, groups[:2]).feasible
@@ -24,4 +24,45 @@ def test_schedule_state_assign_and_unassign():
 
     state.unassign(group)
 
-    assert not group.is_assigned()
\ No newline at end of file
+    assert not group.is_assigned()
+
+def test_vectorized_state_tracks_grid_and_feasible_starts():
+    availability = {
+        ("A1", "Lunes", 7): True,
+        ("A1", "Lunes", 8): True,
+        ("A1", "Lunes", 9): True,
+    }
+
+    tm = TimeModel.from_availability(availability)
+
+    classroom = Classroom("A1", 30, "REGULAR", tm)
+    classroom.occupy(1, 3, 1)
+
+    state = ScheduleState(tm, [classroom], vectorized=True)
+
+    assert state.grid[0, 0].tolist() == [False, False, True]
+    assert state.feasible_starts(2, [0])[0, 0].tolist() == [True, False]
+
+    group = Group("G1", duration=1, required_room_type="REGULAR", size=20)
+
+    assert state.assign(group, "A1", 1, 1)
+    assert state.grid[0, 0].tolist() == [True, False, True]
+
+    state.unassign(group)
+    assert state.grid[0, 0].tolist() == [False, False, True]
+
+
+def test_room_classes_group_identical_classrooms():
+    tm = TimeModel(["Lunes"], [7, 8, 9])
+
+    a1 = Classroom("A1", 30, "REGULAR", tm)
+    a2 = Classroom("A2", 30, "REGULAR", tm)
+    a3 = Classroom("A3", 30, "REGULAR", tm)
+    a3.occupy(1, 1, 1)
+    l1 = Classroom("L1", 30, "LAB", tm)
+
+    classes = ScheduleState(tm, [a1, a2, a3, l1]).room_classes()
+
+    assert classes["A1"] == classes["A2"]
+    assert classes["A3"] != classes["A1"]
+    assert classes["L1"] != classes["A1"]
@@ -3,6 +3,8 @@ from src.scheduling.schedule_state import ScheduleState
 from src.scheduling.time_model import TimeModel
 from src.scheduling.classroom import Classroom
 from src.scheduling.group import Group
+from src.scheduling.conflict_index import ConflictIndex
+from src.scheduling.course import Course
 
 def test_scheduler_simple_case():
     availability = {
@@ -41,4 +43,245 @@ def test_scheduler_no_solution():
 
     result = scheduler.schedule(state, [group1, group2])
 
-    assert not result
\ No newline at end of file
+    assert not result
+
+def test_scheduler_vectorized_state_matches_plain_state():
+    availability = {
+        ("A1", "Lunes", 7): True,
+        ("A1", "Lunes", 8): True,
+        ("A1", "Lunes", 9): True,
+        ("A1", "Martes", 7): True,
+    }
+
+    tm = TimeModel.from_availability(availability)
+
+    for vectorized in (False, True):
+        classroom = Classroom("A1", 30, "REGULAR", tm)
+        state = ScheduleState(tm, [classroom], vectorized=vectorized)
+
+        groups = [
+            Group("G1", duration=2, required_room_type="REGULAR", size=10),
+            Group("G2", duration=3, required_room_type="REGULAR", size=10),
+        ]
+
+        assert Scheduler().schedule(state, groups)
+        assert len(state.assignments) == 2
+
+
+def test_scheduler_orders_values_by_least_constraining():
+    tm = TimeModel(["Lunes", "Martes"], [7, 8, 9])
+
+    big = Classroom("X", 40, "REGULAR", tm)
+    big.occupy(2, 3, 1)
+    rooms = [big] + [Classroom(f"A{i}", 35, "REGULAR", tm) for i in range(3)]
+
+    state = ScheduleState(tm, rooms)
+
+    # S sólo cabe en X y se asigna primero (dominio menor). El lunes en X es la
+    # única opción de U en esa aula, así que LCV manda a S al martes.
+    groups = [
+        Group("S", duration=1, required_room_type="REGULAR", size=40),
+        Group("U", duration=3, required_room_type="REGULAR", size=35),
+    ]
+
+    assert Scheduler().schedule(state, groups)
+    assert state.assignments["S"] == ("X", 2, 1)
+
+
+def test_scheduler_handles_more_groups_than_recursion_limit():
+    import sys
+
+    hours = list(range(7, 17))
+    availability = {("A1", "Lunes", h): True for h in hours}
+    tm = TimeModel.from_availability(availability)
+
+    classrooms = []
+    groups = []
+    for k in range(sys.getrecursionlimit() // len(hours) + 20):
+        room_type = f"T{k}"
+        classrooms.append(Classroom(f"R{k}", 30, room_type, tm))
+        groups.extend(
+            Group(f"C{k}-G{i}", duration=1, required_room_type=room_type)
+            for i in range(len(hours))
+        )
+
+    state = ScheduleState(tm, classrooms)
+
+    assert Scheduler().schedule(state, groups)
+    assert len(state.assignments) == len(groups)
+
+
+
+def test_scheduler_places_sibling_groups_in_lexicographic_order():
+    availability = {("A1", "Lunes", h): True for h in range(7, 12)}
+
+    tm = TimeModel.from_availability(availability)
+
+    classroom = Classroom("A1", 30, "REGULAR", tm)
+    state = ScheduleState(tm, [classroom])
+
+    groups = Course("MAT101", 3, 1, "REGULAR").generate_groups()
+
+    assert Scheduler().schedule(state, groups)
+
+    starts = [state.assignments[f"MAT101-G{i}"][2] for i in (1, 2, 3)]
+    assert starts == sorted(starts)
+
+
+def test_scheduler_symmetry_breaking_keeps_infeasible_result():
+    availability = {("A1", "Lunes", h): True for h in range(7, 10)}
+
+    tm = TimeModel.from_availability(availability)
+
+    for symmetry_breaking in (False, True):
+        classroom = Classroom("A1", 30, "REGULAR", tm)
+        state = ScheduleState(tm, [classroom])
+
+        groups = Course("MAT101", 4, 1, "REGULAR").generate_groups()
+
+        assert not Scheduler(symmetry_breaking=symmetry_breaking, presolve=False).schedule(state, groups)
+        assert state.assignments == {}
+
+
+def test_scheduler_branches_once_per_room_class():
+    tm = TimeModel(["Lunes"], [7, 8])
+
+    nodes = {}
+    for room_symmetry in (True, False):
+        classrooms = [Classroom(f"A{i}", 30, "REGULAR", tm) for i in range(1, 4)]
+        state = ScheduleState(tm, classrooms)
+
+        # Siete grupos en seis celdas: hay que recorrer todo el árbol
+        groups = [Group(f"G{i}", 1, "REGULAR") for i in range(7)]
+
+        scheduler = Scheduler(room_symmetry=room_symmetry, presolve=False)
+        assert not scheduler.schedule(state, groups)
+        nodes[room_symmetry] = scheduler.nodes
+
+    # Tres aulas idénticas: sólo se ramifica sobre los bloques
+    assert nodes[True] * 5 < nodes[False]
+
+    groups = Course("FIS101", 5, 1, "REGULAR").generate_groups()
+    assert Scheduler().schedule(state, groups)
+    assert len(state.assignments) == 5
+
+
+def _labs_that_do_not_fit():
+    tm = TimeModel(["Lunes"], list(range(7, 19)))
+
+    lab = Classroom("L1", 30, "LAB", tm)
+    rooms = [Classroom(f"A{i}", 30 + i, "REGULAR", tm) for i in range(3)]
+    for room in rooms:
+        room.occupy(1, 4, 9)
+
+    state = ScheduleState(tm, [lab] + rooms)
+
+    # Cinco laboratorios de 3 bloques no caben en 12 bloques; los grupos
+    # regulares se asignan antes (dominio menor) pero no causan el fallo.
+    groups = [Group(f"LAB{i}", 3, "LAB") for i in range(5)]
+    groups += [Group(f"R{i}", 1, "REGULAR") for i in range(8)]
+
+    return state, groups
+
+
+def test_scheduler_backjumps_over_unrelated_assignments():
+    state, groups = _labs_that_do_not_fit()
+
+    scheduler = Scheduler(presolve=False)
+
+    assert not scheduler.schedule(state, groups)
+    assert scheduler.nodes < 1000
+    assert state.assignments == {}
+
+
+def test_scheduler_node_budget_is_reported_apart_from_infeasibility():
+    state, groups = _labs_that_do_not_fit()
+
+    # Sin backjumping la prueba de infactibilidad es enorme: se agota el presupuesto
+    scheduler = Scheduler(backjumping=False, presolve=False)
+    assert not scheduler.schedule(state, groups, node_limit=200)
+    assert scheduler.status == "budget"
+    assert scheduler.nodes <= 200
+    assert state.assignments == {}
+
+    scheduler = Scheduler(restarts="luby", restart_base=5, seed=1, presolve=False)
+    assert not scheduler.schedule(state, groups, time_limit=10)
+    assert scheduler.status == "infeasible"
+
+
+def test_scheduler_budget_stop_restores_conflict_loads():
+    for node_limit in range(1, 11):
+        state, groups = _labs_that_do_not_fit()
+
+        scheduler = Scheduler(backjumping=False, presolve=False)
+        assert not scheduler.schedule(state, groups, node_limit=node_limit)
+
+        expected = ConflictIndex.from_groups(groups).load
+        loads = scheduler._conflicts.load
+
+        assert {k: v for k, v in loads.items() if v} == {k: v for k, v in expected.items() if v}
+
+
+def test_scheduler_restarts_find_a_schedule():
+    tm = TimeModel(["Lunes", "Martes"], list(range(7, 13)))
+
+    classrooms = [Classroom(f"A{i}", 30 + i, "REGULAR", tm) for i in range(3)]
+    state = ScheduleState(tm, classrooms)
+
+    groups = []
+    for code in ("MAT101", "FIS101", "QUI101", "BIO101"):
+        groups += Course(code, 2, 3, "REGULAR").generate_groups()
+
+    for strategy in ("luby", "geometric"):
+        scheduler = Scheduler(restarts=strategy, restart_base=1, seed=7)
+        assert scheduler.schedule(state, groups, time_limit=10)
+        assert scheduler.status == "solved"
+        assert scheduler.runs > 1
+        assert len(state.assignments) == len(groups)
+
+        for group in groups:
+            state.unassign(group)
+
+
+def test_scheduler_domwdeg_focuses_on_failing_groups():
+    state, groups = _labs_that_do_not_fit()
+
+    # Sin backjumping, MRV reparte el esfuerzo entre los grupos regulares;
+    # dom/wdeg aprende que los laboratorios son los que fallan.
+    scheduler = Scheduler(backjumping=False, variable_heuristic="domwdeg", presolve=False)
+    assert not scheduler.schedule(state, groups, node_limit=10000)
+    assert scheduler.status == "infeasible"
+
+    scheduler = Scheduler(backjumping=False, presolve=False)
+    assert not scheduler.schedule(state, groups, node_limit=10000)
+    assert scheduler.status == "budget"
+
+
+def test_scheduler_presolve_fails_without_searching():
+    state, groups = _labs_that_do_not_fit()
+
+    scheduler = Scheduler()
+    assert not scheduler.schedule(state, groups)
+    assert scheduler.status == "infeasible"
+    assert scheduler.nodes == 0
+    assert list(scheduler.presolve_report.by_room_type()) == ["LAB"]
+
+
+def test_scheduler_cumulative_check_counts_groups_forced_into_a_block():
+    tm = TimeModel(["Lunes"], [7, 8, 9])
+
+    nodes = {}
+    for cumulative in (True, False):
+        state = ScheduleState(tm, [Classroom(f"A{i}", 30, "REGULAR", tm) for i in range(2)])
+
+        # Cualquier corrida de 2 bloques en 3 pasa por el bloque central:
+        # tres grupos no caben en dos aulas.
+        groups = [Group(f"G{i}", 2, "REGULAR") for i in range(3)]
+
+        scheduler = Scheduler(presolve=False, cumulative=cumulative)
+        assert not scheduler.schedule(state, groups)
+        assert scheduler.status == "infeasible"
+        nodes[cumulative] = scheduler.nodes
+
+    assert nodes[True] == 0
+    assert nodes[False] > 0
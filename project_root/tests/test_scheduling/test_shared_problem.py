@@ -0,0 +1,56 @@
+import pytest
+
+from src.scheduling.shared_problem import SharedProblem, attach
+from src.scheduling.schedule_state import ScheduleState
+from src.scheduling.time_model import TimeModel
+from src.scheduling.classroom import Classroom
+from src.scheduling.group import Group
+from src.scheduling.course import Course
+
+
+def _state(tm):
+    rooms = [Classroom("A1", 30, "REGULAR", tm), Classroom("L1", 20, "LAB", tm)]
+    rooms[0].occupy(2, 3, 2)
+    return ScheduleState(tm, rooms, vectorized=True)
+
+
+def test_attach_rebuilds_the_instance_from_shared_memory():
+    tm = TimeModel(["Lunes", "Martes"], [7, 8, 9, 10])
+    state = _state(tm)
+
+    groups = Course("MAT101", 2, 2, "REGULAR").generate_groups()
+    for group in groups:
+        group.size = 25
+    groups += [Group("QUI101-G1", 1, "LAB", size=15)]
+
+    with SharedProblem(state, groups) as shared:
+        copy, copied_groups = attach(shared.handle)
+
+        assert attach(shared.handle)[0] is copy
+        assert copy is not state
+        assert list(copy.classrooms) == ["A1", "L1"]
+        assert copy.classrooms["A1"].occupancy == {2: 0b11000}
+        assert copy.classrooms["L1"].room_type == "LAB"
+        assert copy.grid.tolist() == state.grid.tolist()
+
+        assert [
+            (g.group_id, g.duration, g.required_room_type, g.size, g.course_code)
+            for g in copied_groups
+        ] == [
+            (g.group_id, g.duration, g.required_room_type, g.size, g.course_code)
+            for g in groups
+        ]
+
+        # Asignar en la copia no toca el original
+        assert copy.assign(copied_groups[0], "A1", 1, 1)
+        assert state.assignments == {}
+        copy.unassign(copied_groups[0])
+
+        handle = shared.handle
+
+    # Otro problema reemplaza al adjuntado; los bloques liberados ya no existen
+    with SharedProblem(_state(tm), groups[:1]) as other:
+        assert len(attach(other.handle)[1]) == 1
+
+    with pytest.raises(FileNotFoundError):
+        attach(handle)
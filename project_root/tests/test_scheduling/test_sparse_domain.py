@@ -0,0 +1,20 @@
+from src.scheduling.sparse_domain import SparseDomain
+
+
+def test_sparse_domain_remove_and_undo_in_reverse_order():
+    domain = SparseDomain(["a", "b", "c", "d"])
+
+    assert domain.remove(1)
+    assert domain.remove(3)
+    assert not domain.remove(1)
+
+    assert len(domain) == 2
+    assert sorted(domain) == ["a", "c"]
+    assert 3 not in domain.positions()
+
+    domain.undo_remove()
+    domain.undo_remove()
+
+    assert len(domain) == 4
+    assert sorted(domain) == ["a", "b", "c", "d"]
+    assert list(domain) == ["a", "c", "d", "b"]
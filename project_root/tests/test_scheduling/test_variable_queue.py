@@ -0,0 +1,42 @@
+from src.scheduling.group import Group
+from src.scheduling.variable_queue import VariableQueue
+
+
+def _group(group_id, domain_size):
+    group = Group(group_id, duration=1, required_room_type="REGULAR")
+    group.domain = list(range(domain_size))
+    return group
+
+
+def test_variable_queue_pops_smallest_domain_then_highest_degree():
+    small = _group("G1", 2)
+    busy = _group("G2", 3)
+    quiet = _group("G3", 3)
+
+    queue = VariableQueue({small: 0, busy: 5, quiet: 1})
+    for group in (quiet, busy, small):
+        queue.push(group)
+
+    assert queue.pop() is small
+    assert queue.pop() is busy
+    assert queue.pop() is quiet
+    assert len(queue) == 0
+
+
+def test_variable_queue_lazy_update_skips_popped_groups():
+    first = _group("G1", 5)
+    second = _group("G2", 4)
+
+    queue = VariableQueue()
+    queue.push(first)
+    queue.push(second)
+
+    first.domain = [0]
+    queue.update(first)
+
+    assert queue.pop() is first
+
+    # Un grupo ya sacado de la cola no vuelve a entrar por update()
+    queue.update(first)
+    assert queue.pop() is second
+    assert len(queue) == 0